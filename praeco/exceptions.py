@@ -14,7 +14,7 @@ class ValidationError(PraecoError, ValueError):
     """Raised when user input is invalid (e.g. empty dataset name)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpError(PraecoError):
     """Raised when an HTTP request fails."""
 
@@ -26,7 +26,10 @@ class HttpError(PraecoError):
     payload: Any | None = None
 
     def __str__(self) -> str:
-        parts = [f"{self.method} {self.url}"]
+        head = f"{self.method} {self.url}"
+        if self.status_code is None and not self.message:
+            return head
+        parts = [head]
         if self.status_code is not None:
             parts.append(f"status={self.status_code}")
         if self.message:
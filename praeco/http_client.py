@@ -24,13 +24,25 @@ session
     Optional externally managed requests session.
 """
 
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self, TypeVar
 
 import requests
 
 from praeco.transport.auth import bearer_headers
-from praeco.transport.request import read_json, read_text
-from praeco.transport.session import create_session
+from praeco.transport.request import (
+    check_status,
+    iter_text,
+    read_json,
+    read_text,
+    write_file,
+)
+from praeco.transport.session import DEFAULT_POOL_MAXSIZE, create_session
 from praeco.transport.url import normalize_base_url
 
 
@@ -64,12 +76,36 @@ class HttpClient:
             self._address, default_scheme=self._default_scheme
         )
 
+        # Only sessions created here are closed by `close()`; injected sessions
+        # stay under the caller's control.
+        self._owns_session = session is None
         self._session = session or create_session()
 
         # token is mutable; use the setter to keep session headers in sync
         self._token: str | None = None
         self.token = token
 
+    def __enter__(self) -> Self:
+        """Return the client for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections of a session created by this client.
+
+        Externally managed sessions passed as `session` are left open.
+        """
+        if self._owns_session:
+            self._session.close()
+
     @classmethod
     def _validate_default_scheme(cls, default_scheme: str) -> str:
         """Validate and normalize the default URL scheme."""
@@ -184,6 +220,17 @@ class HttpClient:
         """Set the request timeout after validation."""
         self._timeout = self._validate_timeout(timeout)
 
+    def url_for(self, *segments: str) -> str:
+        """Build a URL below `base_url` from path segments.
+
+        Same joining rules as `praeco.transport.url.join_url`, but the base URL
+        is already normalized, so it is neither re-validated nor re-stripped.
+        """
+        parts = [s.strip("/") for s in segments if s and s.strip().strip("/")]
+        if not parts:
+            return self._base_url
+        return self._base_url + "/" + "/".join(parts)
+
     def request(
         self,
         method: str,
@@ -210,6 +257,32 @@ class HttpClient:
             stream=stream,
         )
 
+    def preconnect(self, url: str | None = None) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Sends a ``HEAD`` request to `url` (default: `base_url`) and discards
+        the response whatever its status, so the TCP and TLS handshakes are
+        already done when the first real request is sent, e.g. while a
+        notebook is still being set up. Connection errors propagate.
+        """
+        self.request("HEAD", url or self._base_url).close()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Any | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Send a request for its side effect, checking only the status.
+
+        The response body is not decoded. It is still read (without
+        ``stream=True``) so the connection goes back to the pool instead of
+        being dropped.
+        """
+        check_status(self.request(method, url, data=data, headers=headers))
+
     def get_text(
         self,
         url: str,
@@ -220,6 +293,28 @@ class HttpClient:
         """Send a GET request and return the response body as text."""
         return read_text(self.request("GET", url, params=params, headers=headers))
 
+    def get_texts(
+        self,
+        urls: Iterable[str],
+        *,
+        headers: dict[str, str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Send independent GET requests concurrently and return their bodies.
+
+        The requests run on a thread pool and share this client's session, so
+        they reuse its pooled keep-alive connections. `max_workers` defaults
+        to the per-host pool size of sessions created by praeco; larger values
+        (or a smaller injected pool) make the extra requests open throwaway
+        connections.
+
+        Results are returned in the order of `urls`. The first failing request
+        raises its `HttpError`.
+        """
+        return _fan_out(
+            partial(self.get_text, headers=headers), list(urls), max_workers
+        )
+
     def get_json(
         self,
         url: str,
@@ -227,8 +322,64 @@ class HttpClient:
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
     ) -> Any:
-        """Send a GET request and decode the response body as JSON."""
-        return read_json(self.request("GET", url, params=params, headers=headers))
+        """Send a GET request and decode the response body as JSON.
+
+        ``Accept: application/json`` is sent unless `headers` overrides it.
+        """
+        merged = {"Accept": "application/json"}
+        merged.update(headers or {})
+        return read_json(self.request("GET", url, params=params, headers=merged))
+
+    def download(
+        self,
+        url: str,
+        path: str | PathLike[str],
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 1 << 16,
+    ) -> Path:
+        """Stream a GET response body to `path` without buffering it in memory.
+
+        `chunk_size` should be a multiple of the OS page size.
+        """
+        resp = self.request("GET", url, params=params, headers=headers, stream=True)
+        return write_file(resp, path, chunk_size=chunk_size)
+
+    def iter_text(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = 1 << 16,
+    ) -> Iterator[str]:
+        """Send a streamed GET request and iterate over the decoded body.
+
+        The request is sent and its status checked right away; the body is
+        then read and decoded chunk by chunk while iterating.
+        """
+        resp = self.request("GET", url, params=params, headers=headers, stream=True)
+        return iter_text(resp, chunk_size=chunk_size)
+
+    def downloads(
+        self,
+        targets: Iterable[tuple[str, str | PathLike[str]]],
+        *,
+        headers: dict[str, str] | None = None,
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """Stream independent GET responses to files concurrently.
+
+        `targets` yields ``(url, path)`` pairs. Like `get_texts`, the downloads
+        run on a thread pool sharing this client's session. Paths are returned
+        in the order of `targets`; the first failing download raises.
+        """
+        return _fan_out(
+            lambda target: self.download(*target, headers=headers),
+            list(targets),
+            max_workers,
+        )
 
     def put_text(
         self,
@@ -262,3 +413,18 @@ class HttpClient:
     def delete_text(self, url: str, *, headers: dict[str, str] | None = None) -> str:
         """Send a DELETE request and return the response body as text."""
         return read_text(self.request("DELETE", url, headers=headers))
+
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _fan_out(
+    fn: Callable[[_T], _R], items: list[_T], max_workers: int | None
+) -> list[_R]:
+    """Map `fn` over `items` on a thread pool, preserving order."""
+    if not items:
+        return []
+    workers = min(max_workers or DEFAULT_POOL_MAXSIZE, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fn, items))
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from praeco.exceptions import ValidationError
 from praeco.services.dataportal.models import DataportalDatasetInfo
-from praeco.transport.url import join_url, quote_path_segment
+from praeco.transport.url import quote_path_segment
 
 if TYPE_CHECKING:
     from praeco.services.dataportal.client import DataportalClient
@@ -30,15 +30,12 @@ class RdfResource:
         """Build the ckanext-dcat RDF URL for a dataset."""
         dataset_id = _dataset_id(dataset)
         rdf_format = _rdf_format(format)
-        return join_url(
-            self.client.base_url,
-            segments=[
-                "dataset",
-                quote_path_segment(
-                    f"{dataset_id}.{rdf_format}",
-                    field_name="dataset RDF path",
-                ),
-            ],
+        return self.client.url_for(
+            "dataset",
+            quote_path_segment(
+                f"{dataset_id}.{rdf_format}",
+                field_name="dataset RDF path",
+            ),
         )
 
     def dataset(
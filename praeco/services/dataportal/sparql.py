@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import http.cookiejar
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any, TypeAlias
 from urllib.parse import urlsplit
 
-import pandas as pd
 import requests
 
 from praeco.exceptions import ValidationError
@@ -16,9 +16,12 @@ from praeco.services.dataportal.models import (
     DataportalAssetInfo,
     DataportalDatasetInfo,
 )
-from praeco.transport.request import read_text
+from praeco.transport.request import loads_json, read_text
+from praeco.transport.session import create_session
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from praeco.services.dataportal.client import DataportalClient
 
 SparqlTarget: TypeAlias = str | DataportalDatasetInfo | DataportalAssetInfo
@@ -64,7 +67,9 @@ class SparqlResource:
         if _same_origin(endpoint, self.client.base_url):
             return self.client.get_text(endpoint, params=params, headers=headers)
 
-        response = requests.get(
+        # Never send Dataportal credentials to a foreign origin, but still reuse
+        # pooled keep-alive connections across repeated queries.
+        response = _anonymous_session().get(
             endpoint,
             params=params,
             headers=headers,
@@ -79,7 +84,7 @@ class SparqlResource:
         query: str,
     ) -> dict[str, Any]:
         """Execute a SPARQL query and decode its JSON result."""
-        result = json.loads(
+        result = loads_json(
             self.query_raw(
                 target,
                 query,
@@ -104,6 +109,16 @@ class SparqlResource:
         )
 
 
+@cache
+def _anonymous_session() -> requests.Session:
+    """Return the shared session used for cross-origin SPARQL endpoints."""
+    s = create_session()
+    # Shared process-wide, so never store or replay cookies across endpoints,
+    # clients or tokens.
+    s.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return s
+
+
 def _dataset_endpoint(dataset: DataportalDatasetInfo) -> str:
     resources = dataset.raw.get("resources")
     if not isinstance(resources, list):
@@ -170,6 +185,9 @@ def _make_dataframe(
     result: Mapping[str, Any],
     columns: list[str],
 ) -> pd.DataFrame:
+    # Deferred so importing praeco does not load pandas.
+    import pandas as pd
+
     raw_results = result.get("results")
     if not isinstance(raw_results, Mapping):
         raise ValidationError("SPARQL JSON response must include results")
@@ -2,10 +2,37 @@
 Compatibility helpers for Ontodocker deployments with legacy quirks.
 """
 
+from __future__ import annotations
+
 import ast
+import json
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from urllib.parse import urlsplit
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Legacy endpoint quirks and their replacements, applied in a single scan.
+_RECTIFY_MAP = {
+    "http:": "https:",
+    ":None/api/jena": "/api/v1/jena",
+    ":443/api/jena": "/api/v1/jena",
+}
+_RECTIFY_RE = re.compile("|".join(map(re.escape, _RECTIFY_MAP)))
+
+# Dataset segment of an endpoint path: api/v1/jena/<dataset>[/sparql][/...].
+# Repeated slashes are tolerated, matching the previous split-and-filter logic.
+_DATASET_PATH_RE = re.compile(r"/*api/+v1/+jena/+([^/]+)")
+
+# Path of a plain http(s) URL: printable-ASCII host without IPv6 brackets, no
+# query, fragment or characters that `urlsplit` would strip or reject. The path
+# must start right after the host, so any other character there (brackets,
+# non-ASCII, whitespace) fails the match and the URL goes through `urlsplit`.
+_PLAIN_URL_PATH_RE = re.compile(
+    r"https?://(?:(?![/?#\[\]])[!-~])*+((?:/[^?#\t\r\n]*)?)\Z"
+)
 
 
 def rectify_endpoints(result: str) -> str:
@@ -22,10 +49,7 @@ def rectify_endpoints(result: str) -> str:
     normalized
         Normalized response string.
     """
-    result = result.replace("http:", "https:")
-    result = result.replace(":None/api/jena", "/api/v1/jena")
-    result = result.replace(":443/api/jena", "/api/v1/jena")
-    return result
+    return _RECTIFY_RE.sub(lambda m: _RECTIFY_MAP[m.group(0)], result)
 
 
 def parse_endpoints_response(text: str, *, rectify: bool = True) -> list[str]:
@@ -35,8 +59,9 @@ def parse_endpoints_response(text: str, *, rectify: bool = True) -> list[str]:
     Parameters
     ----------
     text
-        Raw response body. Some Ontodocker deployments return a Python literal
-        representation of a list rather than JSON.
+        Raw response body. JSON is parsed directly; some Ontodocker deployments
+        return a Python literal representation of a list instead, which is
+        accepted as a fallback.
     rectify
         If True, apply `rectify_endpoints` before parsing.
 
@@ -54,11 +79,15 @@ def parse_endpoints_response(text: str, *, rectify: bool = True) -> list[str]:
         text = rectify_endpoints(text)
 
     try:
-        value = ast.literal_eval(text)
-    except (SyntaxError, ValueError, MemoryError) as e:
-        raise ValueError(
-            f"Failed to parse endpoints response as Python literal list: {e}"
-        ) from e
+        value = json.loads(text)
+    except ValueError:
+        # Legacy deployments return the Python repr (single-quoted strings).
+        try:
+            value = ast.literal_eval(text)
+        except (SyntaxError, ValueError, MemoryError) as e:
+            raise ValueError(
+                f"Failed to parse endpoints response as JSON or Python literal list: {e}"
+            ) from e
 
     if not isinstance(value, list) or not all(isinstance(x, str) for x in value):
         raise ValueError(
@@ -87,23 +116,19 @@ def extract_dataset_names(sparql_endpoints: list[str]) -> list[str]:
     ValueError
         If an endpoint does not match the expected path format.
     """
-    dataset_names: list[str] = []
-    for endpoint in sparql_endpoints:
-        parts = urlsplit(endpoint)
-        path = parts.path.rstrip("/")
-        segments = [s for s in path.split("/") if s]
+    return [_endpoint_to_dataset(endpoint) for endpoint in sparql_endpoints]
 
-        # expected: ["api","v1","jena", "<dataset>", "sparql"] (or without trailing "sparql")
-        if (
-            len(segments) >= 5
-            and segments[:3] == ["api", "v1", "jena"]
-            and segments[-1] == "sparql"
-        ) or (len(segments) >= 4 and segments[:3] == ["api", "v1", "jena"]):
-            dataset_names.append(segments[3])
-        else:
-            raise ValueError(f"Unexpected SPARQL endpoint format: {endpoint}")
 
-    return dataset_names
+@lru_cache(maxsize=256)
+def _endpoint_to_dataset(endpoint: str) -> str:
+    # Endpoint lists are re-fetched on every `list()`, but rarely change, so
+    # most lookups are cache hits. Invalid endpoints raise and are not cached.
+    plain = _PLAIN_URL_PATH_RE.match(endpoint)
+    path = plain.group(1) if plain else urlsplit(endpoint).path
+    m = _DATASET_PATH_RE.match(path)
+    if m:
+        return m.group(1)
+    raise ValueError(f"Unexpected SPARQL endpoint format: {endpoint}")
 
 
 def make_dataframe(result: dict, columns: list[str]) -> pd.DataFrame:
@@ -126,12 +151,20 @@ def make_dataframe(result: dict, columns: list[str]) -> pd.DataFrame:
     KeyError
         If expected top-level keys are missing.
     """
-    rows: list[list[str | None]] = []
-    for binding in result["results"]["bindings"]:
-        row: list[str | None] = []
-        for column in columns:
-            value = binding.get(column)
-            row.append(value.get("value") if isinstance(value, dict) else None)
-        rows.append(row)
-
-    return pd.DataFrame(rows, columns=columns)
+    # pandas is imported on first use so listing, uploads and downloads do not
+    # pay its import cost.
+    import pandas as pd
+
+    bindings = result["results"]["bindings"]
+    if not bindings:
+        # Empty lists would infer float64 columns; keep the row-wise object dtype.
+        return pd.DataFrame([], columns=columns)
+    # Build column-wise so pandas ingests one list per column, no transposition.
+    data = {
+        column: [
+            value.get("value") if isinstance(value := b.get(column), dict) else None
+            for b in bindings
+        ]
+        for column in columns
+    }
+    return pd.DataFrame(data, columns=columns)
@@ -0,0 +1,17 @@
+"""Input validation helpers shared by the Ontodocker resources."""
+
+from __future__ import annotations
+
+from praeco.exceptions import ValidationError
+
+
+def require_name(value: str, field_name: str) -> str:
+    """Return `value` stripped, or raise if it is not a non-blank string.
+
+    A single `str.strip` serves both the emptiness check and the returned
+    value, which callers use directly to build URLs.
+    """
+    text = value.strip() if isinstance(value, str) else ""
+    if not text:
+        raise ValidationError(f"{field_name} must be non-empty")
+    return text
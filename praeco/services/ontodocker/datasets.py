@@ -2,31 +2,55 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal, TypeAlias, overload
 
 import rdflib
 
 from praeco.exceptions import ValidationError
-from praeco.transport.url import join_url
+from praeco.services.ontodocker._validation import require_name
+from praeco.transport.multipart import MultipartFileBody
 
 if TYPE_CHECKING:
     from praeco.services.ontodocker.client import OntodockerClient
 
+# Defined at module level: inside DatasetsResource, `list` names the method.
+ResponseTexts: TypeAlias = list[str]
+
 
 @dataclass
 class DatasetsResource:
     """Ontodocker dataset CRUD operations."""
 
     client: OntodockerClient
+    _jena_prefix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The base URL is fixed per client, so build the dataset prefix once.
+        self._jena_prefix = self.client.url_for("api", "v1", "jena") + "/"
 
     def _dataset_url(self, dataset_name: str) -> str:
-        if not dataset_name or not dataset_name.strip():
-            raise ValidationError("dataset name must be non-empty")
-        dataset = dataset_name.strip()
-        return join_url(self.client.base_url, segments=["api", "v1", "jena", dataset])
+        return self._url_for(require_name(dataset_name, "dataset name"))
+
+    def _url_for(self, dataset: str) -> str:
+        # `dataset` is already validated and stripped
+        return self._jena_prefix + dataset.strip("/")
+
+    @contextmanager
+    def _modifying(self, name: str, *, relisted: bool = False) -> Iterator[None]:
+        # Cached query results of a dataset are stale once it was (possibly)
+        # modified, so drop them whether or not the request succeeded. Creating
+        # or deleting a dataset also invalidates the cached endpoint list.
+        try:
+            yield
+        finally:
+            self.client.sparql.clear_cache(name)
+            if relisted:
+                self.client.endpoints.clear_cache()
 
     def list(self) -> list[str]:
         """List dataset names.
@@ -36,47 +60,79 @@ class DatasetsResource:
         datasets
             Dataset identifiers.
         """
-        return sorted({e.dataset for e in self.client.endpoints.list()})
+        return sorted(dict.fromkeys(e.dataset for e in self.client.endpoints.list()))
+
+    @overload
+    def create(self, name: str, *, return_body: Literal[True] = ...) -> str: ...
+    @overload
+    def create(self, name: str, *, return_body: Literal[False]) -> None: ...
+    @overload
+    def create(self, name: str, *, return_body: bool) -> str | None: ...
 
-    def create(self, name: str) -> str:
+    def create(self, name: str, *, return_body: bool = True) -> str | None:
         """Create an empty dataset.
 
         Parameters
         ----------
         name
             Dataset name.
+        return_body
+            If False, skip decoding the response body and return None. Useful
+            in bulk loops that ignore the server's reply.
 
         Returns
         -------
         response_text
-            Response body returned by the server.
+            Response body returned by the server, or None if `return_body` is
+            False.
 
         Raises
         ------
         ValidationError
             If `name` is empty/blank.
         """
-        return self.client.put_text(self._dataset_url(name))
-
-    def delete(self, name: str) -> str:
+        url = self._dataset_url(name)
+        with self._modifying(name, relisted=True):
+            if not return_body:
+                self.client.send("PUT", url)
+                return None
+            return self.client.put_text(url)
+
+    @overload
+    def delete(self, name: str, *, return_body: Literal[True] = ...) -> str: ...
+    @overload
+    def delete(self, name: str, *, return_body: Literal[False]) -> None: ...
+    @overload
+    def delete(self, name: str, *, return_body: bool) -> str | None: ...
+
+    def delete(self, name: str, *, return_body: bool = True) -> str | None:
         """Delete a dataset.
 
         Parameters
         ----------
         name
             Dataset name.
+        return_body
+            If False, skip decoding the response body and return None. Useful
+            in bulk loops that ignore the server's reply.
 
         Returns
         -------
         response_text
-            Response body returned by the server.
+            Response body returned by the server, or None if `return_body` is
+            False.
 
         Raises
         ------
         ValidationError
             If `name` is empty/blank.
         """
-        return self.client.delete_text(self._dataset_url(name))
+        url = self._dataset_url(name)
+        with self._modifying(name, relisted=True):
+            if not return_body:
+                self.client.send("DELETE", url)
+                return None
+            return self.client.delete_text(url)
 
     def fetch_turtle(self, name: str) -> str:
         """Fetch a dataset as Turtle text.
@@ -98,6 +154,73 @@ class DatasetsResource:
         """
         return self.client.get_text(self._dataset_url(name))
 
+    def iter_turtle(self, name: str, *, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """Stream a dataset as Turtle text chunks.
+
+        Unlike `fetch_turtle`, the document is never held in memory as a whole,
+        so the chunks can be fed to an incremental parser or written elsewhere
+        while the download is still running.
+
+        Parameters
+        ----------
+        name
+            Dataset name.
+        chunk_size
+            Number of bytes read from the socket per chunk.
+
+        Returns
+        -------
+        chunks
+            Iterator of Turtle text chunks. The request is sent when this
+            method is called; the body is read while iterating.
+
+        Raises
+        ------
+        ValidationError
+            If `name` is empty/blank.
+        HttpError
+            If the request fails.
+        """
+        return self.client.iter_text(self._dataset_url(name), chunk_size=chunk_size)
+
+    def fetch_turtles(
+        self,
+        names: Iterable[str],
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, str]:
+        """Fetch several datasets as Turtle text concurrently.
+
+        Requests are independent, so they are issued concurrently through
+        `HttpClient.get_texts` and reuse the session's pooled connections.
+
+        Parameters
+        ----------
+        names
+            Dataset names. Duplicates are fetched once.
+        max_workers
+            Maximum number of concurrent requests. Defaults to the connection
+            pool size of sessions created by praeco.
+
+        Returns
+        -------
+        ttls
+            Turtle documents keyed by dataset name, in the order of `names`.
+
+        Raises
+        ------
+        ValidationError
+            If any name is empty/blank. Raised before any request is sent.
+        HttpError
+            If any of the underlying requests fails.
+        """
+        urls: dict[str, str] = {}
+        for name in names:
+            dataset = require_name(name, "dataset name")
+            urls.setdefault(dataset, self._url_for(dataset))
+        ttls = self.client.get_texts(urls.values(), max_workers=max_workers)
+        return dict(zip(urls, ttls, strict=True))
+
     def download_turtle(self, name: str, filename: str | Path) -> Path:
         """Download a dataset and save it to a Turtle file.
 
@@ -106,7 +229,8 @@ class DatasetsResource:
         name
             Dataset name.
         filename
-            Output file path written with UTF-8 encoding.
+            Output file path. The Turtle bytes are streamed to disk as received
+            from the server.
 
         Returns
         -------
@@ -123,20 +247,78 @@ class DatasetsResource:
         if isinstance(filename, str) and not filename.strip():
             raise ValidationError("filename must be a non-empty path (str/Path)")
 
-        path = Path(filename)
-        content = self.fetch_turtle(name)
-        _ = path.write_text(content, encoding="utf-8")
-        return path
+        return self.client.download(self._dataset_url(name), filename)
+
+    def download_turtles(
+        self,
+        names: Iterable[str] | None = None,
+        directory: str | Path = ".",
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, Path]:
+        """Download several datasets concurrently as ``<name>.ttl`` files.
+
+        Downloads are independent, so they are streamed to disk concurrently
+        through `HttpClient.downloads` and reuse the session's pooled
+        connections.
+
+        Parameters
+        ----------
+        names
+            Dataset names. Duplicates are downloaded once. Defaults to all
+            datasets returned by `list`.
+        directory
+            Existing directory the Turtle files are written to. Relative paths
+            are resolved against the current working directory once, up front.
+        max_workers
+            Maximum number of concurrent downloads. Defaults to the connection
+            pool size of sessions created by praeco.
 
-    def upload_turtlefile(self, name: str, turtlefile: str | Path) -> str:
+        Returns
+        -------
+        paths
+            Absolute paths of the written files keyed by dataset name, in the
+            order of `names`.
+
+        Raises
+        ------
+        ValidationError
+            If any name is empty/blank. Raised before any request is sent.
+        HttpError
+            If any of the downloads fails.
+        OSError
+            If a file cannot be written (e.g. permissions, missing directory).
+        """
+        if names is None:
+            names = self.list()
+
+        # Resolve once so every target is absolute, independent of later chdir.
+        out_dir = Path(directory).resolve()
+        targets: dict[str, tuple[str, Path]] = {}
+        for name in names:
+            dataset = require_name(name, "dataset name")
+            targets.setdefault(
+                dataset, (self._url_for(dataset), out_dir / f"{dataset}.ttl")
+            )
+        paths = self.client.downloads(targets.values(), max_workers=max_workers)
+        return dict(zip(targets, paths, strict=True))
+
+    def upload_turtlefile(
+        self, name: str, turtlefile: str | Path, *, chunk_size: int = 1 << 16
+    ) -> str:
         """Upload a Turtle (.ttl) file into an existing dataset.
 
+        The file is streamed from disk as multipart form data, so it is never
+        held in memory as a whole.
+
         Parameters
         ----------
         name
             Dataset name.
         turtlefile
             Path to a Turtle file on disk.
+        chunk_size
+            Number of bytes read from the file and sent per block.
 
         Returns
         -------
@@ -152,15 +334,71 @@ class DatasetsResource:
         PermissionError
             If `turtlefile` cannot be read.
         """
-        if isinstance(turtlefile, str):
-            turtlefile = turtlefile.strip()
-            if not turtlefile:
-                raise ValidationError("turtlefile must be a non-empty path")
-        path = Path(turtlefile)
+        path = _turtle_path(turtlefile)
+        url = self._dataset_url(name)
+        with self._modifying(name):
+            return self._post_turtlefile(url, path, chunk_size)
+
+    def upload_turtlefiles(
+        self,
+        name: str,
+        turtlefiles: Iterable[str | Path],
+        *,
+        chunk_size: int = 1 << 16,
+    ) -> ResponseTexts:
+        """Upload several Turtle (.ttl) files into an existing dataset.
+
+        Ontodocker accepts one ``file`` form field per upload request, so the
+        files are posted one after another over the client's keep-alive
+        session. All paths are checked before the first upload, so a typo in a
+        later path does not leave the dataset partially populated.
+
+        Parameters
+        ----------
+        name
+            Dataset name.
+        turtlefiles
+            Paths to Turtle files on disk.
+        chunk_size
+            Number of bytes read from each file and sent per block.
+
+        Returns
+        -------
+        response_texts
+            Response bodies returned by the server, in upload order.
+
+        Raises
+        ------
+        ValidationError
+            If `name` or any path is empty/blank.
+        FileNotFoundError
+            If any of the files does not exist.
+        PermissionError
+            If a file cannot be read.
+        """
         url = self._dataset_url(name)
+        paths = [_turtle_path(turtlefile) for turtlefile in turtlefiles]
+        for path in paths:
+            if not path.is_file():
+                raise FileNotFoundError(f"turtlefile does not exist: {path}")
+
+        with self._modifying(name):
+            return [self._post_turtlefile(url, path, chunk_size) for path in paths]
 
+    def _post_turtlefile(self, url: str, path: Path, chunk_size: int) -> str:
+        # Stream the file into the multipart body instead of letting requests
+        # buffer the whole file for `files=`.
         with path.open("rb") as f:
-            return self.client.post_text(url, files={"file": f})
+            body = MultipartFileBody(
+                "file",
+                f,
+                filename=path.name,
+                content_type="text/turtle",
+                chunk_size=chunk_size,
+            )
+            return self.client.post_text(
+                url, data=body, headers={"Content-Type": body.content_type}
+            )
 
     def upload_graph(
         self,
@@ -207,4 +445,13 @@ class DatasetsResource:
 
         bio = BytesIO(ttl_bytes)
         files = {"file": ("graph.ttl", bio, "text/turtle")}
-        return self.client.post_text(url, files=files)
+        with self._modifying(name):
+            return self.client.post_text(url, files=files)
+
+
+def _turtle_path(turtlefile: str | Path) -> Path:
+    if isinstance(turtlefile, str):
+        turtlefile = turtlefile.strip()
+        if not turtlefile:
+            raise ValidationError("turtlefile must be a non-empty path")
+    return Path(turtlefile)
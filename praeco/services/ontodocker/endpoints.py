@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from praeco.services.ontodocker._compat import (
@@ -10,7 +11,6 @@ from praeco.services.ontodocker._compat import (
     parse_endpoints_response,
 )
 from praeco.services.ontodocker.models import EndpointInfo
-from praeco.transport.url import join_url
 
 if TYPE_CHECKING:
     from praeco.services.ontodocker.client import OntodockerClient
@@ -22,18 +22,47 @@ class EndpointsResource:
 
     client: OntodockerClient
     rectify_legacy: bool = True
+    # seconds a fetched endpoint list is reused for; 0 disables caching
+    cache_ttl: float = 0.0
+
+    # (token, rectify_legacy, fetched_at, endpoints) of the last fetch
+    _cached: tuple[str | None, bool, float, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._url = self.client.url_for("api", "v1", "endpoints")
 
     def list_raw(self) -> list[str]:
         """Fetch the raw SPARQL endpoint URLs from `/api/v1/endpoints`.
 
+        If `cache_ttl` is positive, a list fetched less than `cache_ttl`
+        seconds ago with the same token is returned without a request.
+
         Returns
         -------
         endpoints
             List of endpoint URLs as strings.
         """
-        url = join_url(self.client.base_url, segments=["api", "v1", "endpoints"])
-        text = self.client.get_text(url)
-        return parse_endpoints_response(text, rectify=self.rectify_legacy)
+        now = time.monotonic()
+        cached = self._cached
+        if (
+            cached is not None
+            and cached[:2] == (self.client.token, self.rectify_legacy)
+            and now - cached[2] < self.cache_ttl
+        ):
+            return list(cached[3])
+
+        text = self.client.get_text(self._url)
+        endpoints = parse_endpoints_response(text, rectify=self.rectify_legacy)
+        if self.cache_ttl > 0:
+            self._cached = (self.client.token, self.rectify_legacy, now, endpoints)
+        return list(endpoints)
+
+    def clear_cache(self) -> None:
+        """Forget the cached endpoint list, so the next call refetches it."""
+        self._cached = None
 
     def list(self) -> list[EndpointInfo]:
         """List available dataset endpoints.
@@ -47,7 +76,7 @@ class EndpointsResource:
         dataset_names = extract_dataset_names(endpoints)
 
         # Keep the returned order stable as far as possible
-        out: list[EndpointInfo] = []
-        for ds, ep in zip(dataset_names, endpoints, strict=False):
-            out.append(EndpointInfo(dataset=ds, sparql_endpoint=ep))
-        return out
+        return [
+            EndpointInfo(dataset=ds, sparql_endpoint=ep)
+            for ds, ep in zip(dataset_names, endpoints, strict=False)
+        ]
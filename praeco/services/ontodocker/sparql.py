@@ -2,25 +2,47 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-import pandas as pd
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypeAlias
 
 from praeco.exceptions import ValidationError
 from praeco.services.ontodocker._compat import make_dataframe
-from praeco.transport.url import join_url
+from praeco.services.ontodocker._validation import require_name
+from praeco.transport.request import loads_json
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from praeco.services.ontodocker.client import OntodockerClient
 
+# (token, dataset, query, columns) identifying a cached `query_df` result
+_CacheKey: TypeAlias = tuple[str | None, str, str, tuple[str, ...]]
+
 
 @dataclass
 class SparqlResource:
     """SPARQL operations for Ontodocker."""
 
     client: OntodockerClient
+    # maximum number of unpinned `query_df(..., cache=True)` results kept
+    cache_max: int = 128
+    _jena_prefix: str = field(init=False, repr=False, compare=False)
+    _cache: OrderedDict[_CacheKey, pd.DataFrame] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _pinned: dict[_CacheKey, pd.DataFrame] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        _check_cache_max(self.cache_max)
+        # The base URL is fixed per client, so build the dataset prefix once.
+        self._jena_prefix = self.client.url_for("api", "v1", "jena") + "/"
 
     def endpoint(self, dataset: str) -> str:
         """Build the SPARQL endpoint URL for a dataset.
@@ -35,13 +57,8 @@ class SparqlResource:
         endpoint
             Full SPARQL endpoint URL.
         """
-        if not dataset or not dataset.strip():
-            raise ValidationError("dataset must be non-empty")
-
-        return join_url(
-            self.client.base_url,
-            segments=["api", "v1", "jena", dataset.strip(), "sparql"],
-        )
+        name = require_name(dataset, "dataset")
+        return self._jena_prefix + name.strip("/") + "/sparql"
 
     def query_raw(
         self,
@@ -76,19 +93,23 @@ class SparqlResource:
         HttpError
             If the HTTP request fails (non-2xx) or the response cannot be read.
         """
-        if not dataset or not dataset.strip():
-            raise ValidationError("dataset must be non-empty")
-        if not query or not query.strip():
-            raise ValidationError("query must be non-empty")
-
-        url = self.endpoint(dataset.strip())
+        url = self.endpoint(dataset)
+        require_name(query, "query")
         return self.client.get_text(
             url,
             params={"query": query},
             headers={"Accept": accept},
         )
 
-    def query_df(self, dataset: str, query: str, columns: list[str]) -> pd.DataFrame:
+    def query_df(
+        self,
+        dataset: str,
+        query: str,
+        columns: list[str],
+        *,
+        cache: bool = False,
+        pin: bool = False,
+    ) -> pd.DataFrame:
         """Execute a SPARQL query against a dataset and return a pandas DataFrame.
 
         Parameters
@@ -99,6 +120,15 @@ class SparqlResource:
             SPARQL query string.
         columns
             Column labels for the resulting DataFrame.
+        cache
+            If True, reuse the result of an identical earlier cached query
+            (same token, dataset, query and columns; surrounding whitespace of
+            the query is ignored) instead of sending a request. The least
+            recently used results are evicted beyond `cache_max` entries.
+            Cached results are dropped when the dataset is modified through
+            `client.datasets`, or by `clear_cache`.
+        pin
+            Like `cache`, but the result is never evicted by later queries.
 
         Returns
         -------
@@ -110,7 +140,8 @@ class SparqlResource:
         ValidationError
             If `dataset`, `query`, or `columns` are invalid.
         ValueError
-            If the endpoint response cannot be decoded as JSON.
+            If the endpoint response cannot be decoded as JSON, or if caching
+            is requested while `cache_max` is negative.
         HttpError
             If the underlying HTTP request fails.
         """
@@ -123,11 +154,60 @@ class SparqlResource:
         ):
             raise ValidationError("columns must be a non-empty list of strings")
 
+        if not (cache or pin):
+            return self._fetch_df(dataset, query, columns)
+
+        _check_cache_max(self.cache_max)
+        # Normalize the dataset the same way `endpoint` does, so every spelling
+        # of one endpoint shares an entry and `clear_cache` reaches all of them.
+        name = require_name(dataset, "dataset").strip("/")
+        key = (self.client.token, name, require_name(query, "query"), tuple(columns))
+        with self._cache_lock:
+            df = self._pinned.get(key)
+            if df is None and (df := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+        if df is None:
+            df = self._fetch_df(dataset, query, columns)
+            with self._cache_lock:
+                if pin:
+                    self._pinned[key] = df
+                    self._cache.pop(key, None)
+                else:
+                    self._cache[key] = df
+                    while len(self._cache) > self.cache_max:
+                        self._cache.popitem(last=False)
+        # Hand out copies so callers cannot modify the cached frame.
+        return df.copy()
+
+    def clear_cache(self, dataset: str | None = None) -> None:
+        """Drop cached `query_df` results, including pinned ones.
+
+        Parameters
+        ----------
+        dataset
+            Only drop results for this dataset. Defaults to all datasets.
+        """
+        with self._cache_lock:
+            if dataset is None:
+                self._cache.clear()
+                self._pinned.clear()
+                return
+            name = dataset.strip().strip("/")
+            for store in (self._cache, self._pinned):
+                for key in [k for k in store if k[1] == name]:
+                    del store[key]
+
+    def _fetch_df(self, dataset: str, query: str, columns: list[str]) -> pd.DataFrame:
         text = self.query_raw(
             dataset,
             query,
             accept="application/sparql-results+json",
         )
-        result = json.loads(text)
+        result = loads_json(text)
 
         return make_dataframe(result, columns)
+
+
+def _check_cache_max(cache_max: int) -> None:
+    if cache_max < 0:
+        raise ValueError("cache_max must be >= 0")
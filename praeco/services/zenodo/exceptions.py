@@ -8,7 +8,7 @@ from praeco.exceptions import HttpError
 from praeco.services.zenodo.models import ZenodoFieldError
 
 
-@dataclass
+@dataclass(slots=True)
 class ZenodoApiError(HttpError):
     """Raised when Zenodo returns an API error."""
 
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def bearer_headers(token: str | None) -> dict[str, str]:
     """
     Construct Authorization headers for a bearer token.
@@ -12,6 +15,12 @@ def bearer_headers(token: str | None) -> dict[str, str]:
     headers
         Header dict. Empty if `token` is None/blank.
     """
+    # A fresh dict per call keeps the cached items safe from caller mutation.
+    return dict(_bearer_header_items(token))
+
+
+@lru_cache(maxsize=32)
+def _bearer_header_items(token: str | None) -> tuple[tuple[str, str], ...]:
     if token and token.strip():
-        return {"Authorization": f"Bearer {token.strip()}"}
-    return {}
+        return (("Authorization", f"Bearer {token.strip()}"),)
+    return ()
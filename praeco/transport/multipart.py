@@ -0,0 +1,89 @@
+# streamed multipart/form-data bodies for file uploads
+
+import os
+from collections.abc import Iterator
+from io import BytesIO
+from typing import BinaryIO
+
+# HTML5 escaping for quoted header parameters, as urllib3 does for `files=`.
+_PARAM_ESCAPES = {ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"}
+
+
+class MultipartFileBody:
+    """
+    A ``multipart/form-data`` request body with a single file field.
+
+    ``requests`` builds ``files=`` uploads fully in memory before sending. This
+    body instead reads the file lazily while the request is written to the
+    socket, so memory use stays at one read block regardless of file size.
+    Its length is known up front, so the upload is sent with
+    ``Content-Length`` rather than chunked transfer encoding.
+
+    Pass it as ``data=`` together with ``headers={"Content-Type":
+    body.content_type}``. The body is an iterable rather than a file-like
+    object, so urllib3 sends it in blocks of `chunk_size` bytes instead of
+    its own fixed read size.
+
+    Parameters
+    ----------
+    field
+        Form field name.
+    fileobj
+        Binary file object positioned at the start of the content to send. It
+        must support ``seek``/``tell`` and stays owned by the caller.
+    filename
+        File name reported in the ``Content-Disposition`` header.
+    content_type
+        Content type of the file part.
+    chunk_size
+        Number of bytes read from `fileobj` and written to the socket per block.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        fileobj: BinaryIO,
+        *,
+        filename: str,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = 1 << 16,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        boundary = os.urandom(16).hex()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.chunk_size = chunk_size
+
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field.translate(_PARAM_ESCAPES)}"; '
+            f'filename="{filename.translate(_PARAM_ESCAPES)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+        start = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+
+        self._length = len(head) + size + len(tail)
+        self._parts: list[BinaryIO] = [BytesIO(head), fileobj, BytesIO(tail)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _read(self, size: int) -> bytes:
+        chunks: list[bytes] = []
+        remaining = size
+        while self._parts and remaining > 0:
+            data = self._parts[0].read(remaining)
+            if not data:
+                self._parts.pop(0)
+                continue
+            chunks.append(data)
+            remaining -= len(data)
+        return b"".join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self._read(self.chunk_size):
+            yield chunk
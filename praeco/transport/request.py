@@ -1,11 +1,70 @@
 # request/response handling
 
+import json
+import os
+from collections.abc import Iterator
+from contextlib import closing
+from os import PathLike
+from pathlib import Path
 from typing import Any
 
 import requests
 
 from praeco.exceptions import HttpError
 
+try:
+    # Optional speed-up (``pip install praeco[orjson]``): decodes raw bytes
+    # directly and is several times faster than the stdlib decoder.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _declared_charset(resp: requests.Response) -> str | None:
+    """Return the ``charset`` parameter of the ``Content-Type`` header, if any."""
+    headers = getattr(resp, "headers", None) or {}
+    _, *params = headers.get("Content-Type", "").split(";")
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            return value.strip().strip("\"'")
+    return None
+
+
+def _set_text_encoding(resp: requests.Response) -> None:
+    """Decode with the declared charset, else UTF-8.
+
+    This skips `requests`' charset detection on the full body (used when no
+    charset is declared), and avoids its ISO-8859-1 fallback for ``text/*``
+    types such as Turtle, which is UTF-8 by specification.
+    """
+    resp.encoding = _declared_charset(resp) or "utf-8"
+
+
+# Error bodies (e.g. HTML error pages from Jena) are only kept for diagnostics,
+# so decode a bounded prefix unless the full body is explicitly requested.
+_ERROR_BODY_LIMIT = 4096
+_FULL_ERROR_BODY_ENV = "PRAECO_FULL_ERROR_BODY"
+
+
+def _error_body(resp: requests.Response) -> str | None:
+    """Return the (truncated) response body for attaching to an `HttpError`."""
+    if os.environ.get(_FULL_ERROR_BODY_ENV) == "1":
+        return getattr(resp, "text", None)
+    if isinstance(resp, requests.Response) and resp.raw is not None:
+        # Take a single chunk so an unread ``stream=True`` body is only read up
+        # to the limit; an already-read body is sliced from memory.
+        chunk = next(resp.iter_content(chunk_size=_ERROR_BODY_LIMIT), b"")
+        head = chunk[:_ERROR_BODY_LIMIT]
+    elif resp.content is None:
+        return None
+    else:
+        head = resp.content[:_ERROR_BODY_LIMIT]
+    try:
+        return head.decode(_declared_charset(resp) or "utf-8", errors="replace")
+    except LookupError:
+        return head.decode("utf-8", errors="replace")
+
 
 def _raise_for_status_with_body(resp: requests.Response) -> None:
     """
@@ -19,12 +78,13 @@ def _raise_for_status_with_body(resp: requests.Response) -> None:
     Raises
     ------
     HttpError
-        If status code is 4xx/5xx. Includes response text where available.
+        If status code is 4xx/5xx. Includes the first 4 KiB of the response
+        body, or the full body if ``PRAECO_FULL_ERROR_BODY=1`` is set.
     """
     try:
         resp.raise_for_status()
     except requests.HTTPError as e:
-        text = getattr(resp, "text", None)
+        text = _error_body(resp)
         raise HttpError(
             method=(resp.request.method or "HTTP") if resp.request else "HTTP",
             url=resp.url,
@@ -34,6 +94,37 @@ def _raise_for_status_with_body(resp: requests.Response) -> None:
         ) from e
 
 
+def loads_json(data: str | bytes) -> Any:
+    """
+    Decode a JSON document, using `orjson` when installed.
+
+    Parameters
+    ----------
+    data
+        JSON document as text or UTF-8 bytes.
+
+    Returns
+    -------
+    payload
+        Parsed JSON payload.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If `data` is not valid JSON (``orjson.JSONDecodeError`` subclasses it).
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _decode_json(resp: requests.Response) -> Any:
+    """Decode a JSON body, preferring `orjson` on the raw bytes when installed."""
+    if orjson is None:
+        return resp.json()
+    return orjson.loads(resp.content)
+
+
 def read_json(resp: requests.Response) -> Any:
     """
     Decode JSON response after checking status.
@@ -55,17 +146,36 @@ def read_json(resp: requests.Response) -> Any:
     """
     _raise_for_status_with_body(resp)
     try:
-        return resp.json()
+        return _decode_json(resp)
     except ValueError as e:
         raise HttpError(
             method=(resp.request.method or "HTTP") if resp.request else "HTTP",
             url=resp.url,
             status_code=resp.status_code,
             message="Failed to decode JSON response.",
-            response_text=getattr(resp, "text", None),
+            response_text=_error_body(resp),
         ) from e
 
 
+def check_status(resp: requests.Response) -> None:
+    """
+    Check the status of a response whose body is not needed.
+
+    Unlike `read_text`, the body is never decoded to `str`.
+
+    Parameters
+    ----------
+    resp
+        Response object.
+
+    Raises
+    ------
+    HttpError
+        If status indicates error.
+    """
+    _raise_for_status_with_body(resp)
+
+
 def read_text(resp: requests.Response) -> str:
     """
     Decode text response after checking status.
@@ -78,7 +188,8 @@ def read_text(resp: requests.Response) -> str:
     Returns
     -------
     text
-        Response body as text.
+        Response body decoded with the charset declared in ``Content-Type``,
+        or UTF-8 if none is declared.
 
     Raises
     ------
@@ -86,4 +197,98 @@ def read_text(resp: requests.Response) -> str:
         If status indicates error.
     """
     _raise_for_status_with_body(resp)
+    _set_text_encoding(resp)
     return resp.text
+
+
+def iter_text(resp: requests.Response, *, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Check status, then return an iterator over the decoded response body.
+
+    The status is checked immediately, while the body is read and decoded
+    incrementally, so memory use stays at roughly `chunk_size` and multi-byte
+    characters split across chunks are decoded correctly. The response is
+    closed on error, and otherwise once the iterator is exhausted or discarded.
+
+    Parameters
+    ----------
+    resp
+        Response object, ideally requested with ``stream=True``.
+    chunk_size
+        Number of bytes read from the socket per chunk.
+
+    Returns
+    -------
+    chunks
+        Iterator of text chunks, decoded with the charset declared in
+        ``Content-Type``, or UTF-8 if none is declared.
+
+    Raises
+    ------
+    HttpError
+        If status indicates error.
+    """
+    try:
+        _raise_for_status_with_body(resp)
+    except HttpError:
+        resp.close()
+        raise
+    _set_text_encoding(resp)
+    return _iter_decoded(resp, chunk_size)
+
+
+def _iter_decoded(resp: requests.Response, chunk_size: int) -> Iterator[str]:
+    with closing(resp):
+        yield from resp.iter_content(chunk_size=chunk_size, decode_unicode=True)
+
+
+def write_file(
+    resp: requests.Response,
+    path: str | PathLike[str],
+    *,
+    chunk_size: int = 1 << 16,
+) -> Path:
+    """
+    Stream a response body to a file after checking status.
+
+    The body is written in binary mode chunk by chunk, so memory use stays at
+    roughly `chunk_size` regardless of the payload size. The response is closed
+    afterwards. The body goes to a temporary file next to `path`, which replaces
+    `path` only once the whole body has been received; on any error an existing
+    file at `path` is left untouched.
+
+    Parameters
+    ----------
+    resp
+        Response object, ideally requested with ``stream=True``.
+    path
+        Output file path.
+    chunk_size
+        Number of bytes read from the socket per write. Multiples of the OS page
+        size (typically 4 KiB) work best.
+
+    Returns
+    -------
+    path
+        Path written to disk.
+
+    Raises
+    ------
+    HttpError
+        If status indicates error.
+    OSError
+        If the file cannot be written.
+    """
+    with closing(resp):
+        _raise_for_status_with_body(resp)
+        out = Path(path)
+        tmp = out.with_name(f".{out.name}.{os.urandom(4).hex()}.part")
+        try:
+            with tmp.open("xb") as f:
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+            os.replace(tmp, out)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    return out
@@ -1,16 +1,53 @@
 # create requests.Session used for HTTP requests done by praeco
 
+import os
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from praeco import __version__
+
+# Mirrors the default worker count of `concurrent.futures.ThreadPoolExecutor`,
+# so a default-sized thread pool never waits on a free connection.
+DEFAULT_POOL_MAXSIZE = min(32, (os.cpu_count() or 1) + 4)
+
+# Retry transient gateway errors for idempotent methods inside urllib3, so the
+# pooled connection is reused instead of restarting the whole call chain.
+# Retry-After is ignored: a maintenance 503 may ask for hours, and urllib3
+# would sleep that long on each attempt regardless of the request timeout.
+DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD", "PUT", "DELETE"]),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
 
 
-def create_session(*, headers: dict[str, str] | None = None) -> requests.Session:
+def create_session(
+    *,
+    headers: dict[str, str] | None = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: Retry | int = DEFAULT_RETRY,
+) -> requests.Session:
     """
     Create a configured `requests.Session`.
 
     Parameters
     ----------
     headers
-        Default headers to apply to the session.
+        Default headers to apply to the session. They take precedence over
+        the praeco defaults (e.g. ``User-Agent``).
+    pool_connections
+        Number of per-host connection pools to cache.
+    pool_maxsize
+        Maximum number of keep-alive connections kept per host. Requests beyond
+        this limit still succeed, but their connections are discarded afterwards.
+    max_retries
+        Retry policy passed to the mounted adapter. Pass ``0`` to disable retries.
 
     Returns
     -------
@@ -18,6 +55,17 @@ def create_session(*, headers: dict[str, str] | None = None) -> requests.Session
         A `requests.Session` instance.
     """
     s = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        pool_block=False,
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    # requests already negotiates gzip/deflate and keep-alive by default; only
+    # identify the client so server logs can attribute traffic to praeco.
+    s.headers["User-Agent"] = f"praeco/{__version__}"
     if headers:
         s.headers.update(headers)
     return s
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from urllib.parse import quote, urlsplit, urlunsplit
 
 from praeco.exceptions import InvalidAddressError, ValidationError
@@ -44,6 +45,25 @@ def normalize_base_url(
         If `address` is empty/blank, does not contain a host, contains a disallowed
         scheme, or (when `require_host_only` is True) includes a path/query/fragment.
     """
+    return _normalize_base_url(
+        address, default_scheme, tuple(allowed_schemes), require_host_only
+    )
+
+
+# Characters that need urlsplit's handling (path/query/fragment delimiters,
+# IPv6 brackets, whitespace) and thus disqualify the normalized fast path.
+_NETLOC_FAST_REJECT = frozenset(" /?#[]\\")
+
+
+@lru_cache(maxsize=256)
+def _normalize_base_url(
+    address: str,
+    default_scheme: str,
+    allowed_schemes: tuple[str, ...],
+    require_host_only: bool,
+) -> str:
+    # Pure function of its arguments; clients built in loops against the same
+    # address hit the cache. Invalid input raises and is therefore not cached.
     if not address or not address.strip():
         raise InvalidAddressError(
             "address must be a non-empty host, e.g. 'ontodocker.example.org'"
@@ -51,6 +71,22 @@ def normalize_base_url(
 
     raw = address.strip()
 
+    # Fast path: already normalized "scheme://host[:port]" (e.g. a stored
+    # base_url) needs no parsing. Anything unusual, including non-ASCII hosts
+    # that need urlsplit's NFKC check, takes the full path below.
+    for allowed in allowed_schemes:
+        prefix = f"{allowed}://"
+        if raw.startswith(prefix):
+            netloc = raw[len(prefix) :]
+            if (
+                netloc
+                and netloc.isascii()
+                and netloc.isprintable()
+                and _NETLOC_FAST_REJECT.isdisjoint(netloc)
+            ):
+                return raw
+            break
+
     # First, detect malformed URLs where a scheme is present but missing "//",
     # e.g. "http:example.org". In such cases urlsplit(raw) yields a scheme
     # but no netloc, so treat this as an invalid address instead of assuming
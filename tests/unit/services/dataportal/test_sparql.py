@@ -1,10 +1,14 @@
 import unittest
+from email.message import Message
 from typing import Any, cast
 from unittest import mock
 
 import pandas as pd
 import pandas.testing as pdt
+import requests
+from requests.cookies import MockRequest, MockResponse
 
+import praeco.services.dataportal.sparql as sparql_module
 from praeco.exceptions import ValidationError
 from praeco.services.ckan.models import CkanPackageInfo, CkanResourceInfo
 from praeco.services.dataportal import (
@@ -212,10 +216,12 @@ class TestSparqlQueries(unittest.TestCase):
         response = FakeResponse()
         response.text = "external result"
 
+        anonymous = mock.Mock()
+        anonymous.get.return_value = response
         with mock.patch(
-            "praeco.services.dataportal.sparql.requests.get",
-            return_value=response,
-        ) as get:
+            "praeco.services.dataportal.sparql._anonymous_session",
+            return_value=anonymous,
+        ):
             text = client.sparql.query_raw(
                 "https://query.example.test/sparql",
                 "ASK {}",
@@ -224,6 +230,7 @@ class TestSparqlQueries(unittest.TestCase):
 
         self.assertEqual(text, "external result")
         self.assertEqual(session.calls, [])
+        get = anonymous.get
         get.assert_called_once_with(
             "https://query.example.test/sparql",
             params={"query": "ASK {}"},
@@ -233,6 +240,20 @@ class TestSparqlQueries(unittest.TestCase):
         )
         self.assertNotIn("Authorization", get.call_args.kwargs["headers"])
 
+    def test_cross_origin_session_is_shared_and_unauthenticated(self):
+        first = sparql_module._anonymous_session()
+
+        self.assertIs(sparql_module._anonymous_session(), first)
+        self.assertNotIn("Authorization", first.headers)
+
+        headers = Message()
+        headers["Set-Cookie"] = "sid=abc; Path=/"
+        request = requests.Request("GET", "https://query.example.test/sparql")
+        first.cookies.extract_cookies(
+            MockResponse(headers), MockRequest(request.prepare())
+        )
+        self.assertEqual(len(first.cookies), 0)
+
     def test_query_raw_validates_query_and_accept_before_request(self):
         session = FakeSession()
         client = DataportalClient(session=cast(Any, session))
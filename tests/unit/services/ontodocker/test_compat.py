@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import pandas as pd
 import pandas.testing as pdt
@@ -34,6 +35,19 @@ class TestRectifyEndpoints(unittest.TestCase):
         self.assertIn("https://", result)
         self.assertIn("/api/v1/jena", result)
 
+    def test_list_response_rectified_in_one_pass(self):
+        raw = (
+            "['http://a.com:None/api/jena/ds1/sparql', "
+            "'http://b.com:443/api/jena/ds2/sparql', "
+            "'https://c.com/api/v1/jena/ds3/sparql']"
+        )
+        self.assertEqual(
+            _compat.rectify_endpoints(raw),
+            "['https://a.com/api/v1/jena/ds1/sparql', "
+            "'https://b.com/api/v1/jena/ds2/sparql', "
+            "'https://c.com/api/v1/jena/ds3/sparql']",
+        )
+
 
 class TestParseEndpointsResponse(unittest.TestCase):
     def test_valid_list_of_strings(self):
@@ -41,6 +55,16 @@ class TestParseEndpointsResponse(unittest.TestCase):
         result = _compat.parse_endpoints_response(text, rectify=False)
         self.assertEqual(result, ["https://example.com/api/v1/jena/ds/sparql"])
 
+    def test_json_list_of_strings(self):
+        text = '["https://example.com/api/v1/jena/ds/sparql"]'
+        result = _compat.parse_endpoints_response(text, rectify=False)
+        self.assertEqual(result, ["https://example.com/api/v1/jena/ds/sparql"])
+
+    def test_json_is_parsed_without_literal_eval(self):
+        with mock.patch.object(_compat.ast, "literal_eval") as literal_eval:
+            _ = _compat.parse_endpoints_response('["https://a.com"]', rectify=False)
+        literal_eval.assert_not_called()
+
     def test_parse_endpoints_response_empty_list(self):
         result = _compat.parse_endpoints_response("[]", rectify=False)
         self.assertEqual(result, [])
@@ -83,6 +107,14 @@ class TestExtractDatasetNames(unittest.TestCase):
         endpoints = ["https://example.com/api/v1/jena/mydataset"]
         self.assertEqual(_compat.extract_dataset_names(endpoints), ["mydataset"])
 
+    def test_bracketed_ipv6_host(self):
+        endpoints = ["http://[fd00::5]:3030/api/v1/jena/ds/sparql"]
+        self.assertEqual(_compat.extract_dataset_names(endpoints), ["ds"])
+
+    def test_non_ascii_host(self):
+        endpoints = ["https://d\u00e4tenportal.example.de/api/v1/jena/ds/sparql"]
+        self.assertEqual(_compat.extract_dataset_names(endpoints), ["ds"])
+
     def test_multiple_endpoints(self):
         endpoints = [
             "https://example.com/api/v1/jena/ds1/sparql",
@@ -101,6 +133,54 @@ class TestExtractDatasetNames(unittest.TestCase):
     def test_empty_list(self):
         self.assertEqual(_compat.extract_dataset_names([]), [])
 
+    def test_repeated_slashes_and_extra_segments_accepted(self):
+        endpoints = [
+            "https://example.com//api/v1//jena/ds1/sparql",
+            "https://example.com/api/v1/jena/ds2/data?x=1",
+        ]
+        self.assertEqual(_compat.extract_dataset_names(endpoints), ["ds1", "ds2"])
+
+    def test_prefix_must_match_whole_segments(self):
+        for endpoint in (
+            "https://example.com/apix/v1/jena/ds",
+            "https://example.com/api/v1/jenax/ds",
+            "https://example.com/base/api/v1/jena/ds",
+            "https://example.com/api/v1/jena/",
+        ):
+            with (
+                self.subTest(endpoint=endpoint),
+                self.assertRaisesRegex(ValueError, "Unexpected SPARQL endpoint"),
+            ):
+                _compat.extract_dataset_names([endpoint])
+
+    def test_repeated_endpoints_are_parsed_once(self):
+        _compat._endpoint_to_dataset.cache_clear()
+        endpoints = ["https://example.com/api/v1/jena/cached/sparql"] * 3
+
+        self.assertEqual(_compat.extract_dataset_names(endpoints), ["cached"] * 3)
+        self.assertEqual(_compat.extract_dataset_names(endpoints), ["cached"] * 3)
+
+        info = _compat._endpoint_to_dataset.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 5))
+
+    def test_plain_urls_skip_urlsplit(self):
+        _compat._endpoint_to_dataset.cache_clear()
+        with mock.patch.object(_compat, "urlsplit", wraps=_compat.urlsplit) as split:
+            names = _compat.extract_dataset_names(
+                [
+                    "https://example.com:8443/api/v1/jena/fast/sparql",
+                    "https://example.com/api/v1/jena/slow/sparql?x=1",
+                ]
+            )
+
+        self.assertEqual(names, ["fast", "slow"])
+        split.assert_called_once_with("https://example.com/api/v1/jena/slow/sparql?x=1")
+
+    def test_invalid_endpoint_raises_on_every_call(self):
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, "Unexpected SPARQL endpoint"):
+                _compat.extract_dataset_names(["https://example.com/wrong"])
+
 
 class TestMakeDataframe(unittest.TestCase):
     def _make_result(self, vars_: list[str], bindings: list[dict]) -> dict:
@@ -137,6 +217,11 @@ class TestMakeDataframe(unittest.TestCase):
         self.assertEqual(list(df.columns), ["a", "b"])
         self.assertEqual(len(df), 0)
 
+    def test_empty_bindings_keep_object_dtype(self):
+        result = self._make_result(["a", "b"], [])
+        df = _compat.make_dataframe(result, ["a", "b"])
+        pdt.assert_frame_equal(df, pd.DataFrame([], columns=["a", "b"]))
+
     def test_multiple_rows(self):
         result = self._make_result(
             ["x"],
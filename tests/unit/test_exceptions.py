@@ -25,6 +25,12 @@ class TestHttpError(unittest.TestCase):
         self.assertIn("method", names)
         self.assertIn("payload", names)
 
+    def test_fields_are_stored_in_slots(self):
+        self.assertEqual(
+            HttpError.__slots__,
+            ("method", "url", "status_code", "message", "response_text", "payload"),
+        )
+
     def test_fields_roundtrip(self):
         err = HttpError(
             method="GET",
@@ -1,9 +1,14 @@
+import json
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
 
 import requests
 
 from praeco import HttpClient
 from praeco.exceptions import HttpError
+from praeco.transport.url import join_url
 
 
 class _FakeRequest:
@@ -34,12 +39,30 @@ class _FakeResponse:
         self.raise_for_status_called = False
         self.json_called = False
 
+    @property
+    def content(self) -> bytes:
+        if self._json_value is not None:
+            return json.dumps(self._json_value).encode("utf-8")
+        return self.text.encode("utf-8")
+
     def raise_for_status(self):
         self.raise_for_status_called = True
         if self._raise_for_status_exc is not None:
             raise self._raise_for_status_exc
         return None
 
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        if decode_unicode:
+            for start in range(0, len(self.text), chunk_size):
+                yield self.text[start : start + chunk_size]
+            return
+        body = self.text.encode("utf-8")
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
     def json(self):
         self.json_called = True
         if self._json_exc is not None:
@@ -175,6 +198,42 @@ class TestHttpClientValidation(unittest.TestCase):
         self.assertEqual(c.verify, "/path/to/ca.pem")
 
 
+class TestHttpClientLifecycle(unittest.TestCase):
+    def test_context_manager_closes_owned_session(self):
+        c = HttpClient("example.org")
+
+        with mock.patch.object(c.session, "close") as close:
+            with c as entered:
+                self.assertIs(entered, c)
+            close.assert_called_once_with()
+
+    def test_close_leaves_injected_session_open(self):
+        s = _FakeSession()
+        s.close = mock.Mock()
+
+        with HttpClient("example.org", session=s):
+            pass
+
+        s.close.assert_not_called()
+
+
+class TestHttpClientUrlFor(unittest.TestCase):
+    def test_matches_join_url(self):
+        c = HttpClient("https://example.org/", session=_FakeSession())
+        cases = (
+            (),
+            ("api",),
+            ("/api/", "v1", "/jena/"),
+            ("", "/", "api"),
+        )
+        for segments in cases:
+            with self.subTest(segments=segments):
+                self.assertEqual(
+                    c.url_for(*segments),
+                    join_url(c.base_url, segments=list(segments)),
+                )
+
+
 class TestHttpClientRequest(unittest.TestCase):
     def test_request_passes_through_common_arguments(self):
         s = _FakeSession()
@@ -222,6 +281,19 @@ class TestHttpClientConvenienceMethods(unittest.TestCase):
         self.assertEqual(s.calls[0]["method"], "GET")
         self.assertEqual(s.calls[0]["url"], "https://example.org/hello")
 
+    def test_get_texts_returns_bodies_in_url_order(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="hello")
+        c = HttpClient("example.org", session=s)
+
+        urls = [f"https://example.org/{i}" for i in range(5)]
+        out = c.get_texts(urls, headers={"X-Test": "1"}, max_workers=3)
+
+        self.assertEqual(out, ["hello"] * 5)
+        self.assertEqual(sorted(call["url"] for call in s.calls), urls)
+        self.assertTrue(all(call["headers"] == {"X-Test": "1"} for call in s.calls))
+        self.assertEqual(c.get_texts([]), [])
+
     def test_get_json_returns_decoded_json(self):
         s = _FakeSession()
         s.response = _FakeResponse(json_value={"ok": True})
@@ -229,6 +301,21 @@ class TestHttpClientConvenienceMethods(unittest.TestCase):
 
         out = c.get_json("https://example.org/json")
         self.assertEqual(out, {"ok": True})
+        self.assertEqual(s.calls[0]["headers"], {"Accept": "application/json"})
+
+    def test_get_json_accept_header_can_be_overridden(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(json_value={"ok": True})
+        c = HttpClient("example.org", session=s)
+
+        _ = c.get_json(
+            "https://example.org/json",
+            headers={"Accept": "application/ld+json", "X-Test": "1"},
+        )
+        self.assertEqual(
+            s.calls[0]["headers"],
+            {"Accept": "application/ld+json", "X-Test": "1"},
+        )
 
     def test_post_text_returns_response_text(self):
         s = _FakeSession()
@@ -239,6 +326,84 @@ class TestHttpClientConvenienceMethods(unittest.TestCase):
         self.assertEqual(out, "posted")
         self.assertEqual(s.calls[0]["method"], "POST")
 
+    def test_download_streams_body_to_file_in_chunks(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="0123456789")
+        c = HttpClient("example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "body.bin"
+            out = c.download("https://example.org/file", str(path), chunk_size=4)
+
+            self.assertEqual(out, path)
+            self.assertEqual(path.read_bytes(), b"0123456789")
+        self.assertEqual(s.calls[0]["method"], "GET")
+        self.assertTrue(s.calls[0]["stream"])
+        self.assertTrue(s.response.closed)
+
+    def test_failed_download_keeps_existing_file(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="0123456789")
+        s.response.iter_content = mock.Mock(
+            side_effect=requests.ConnectionError("connection reset")
+        )
+        c = HttpClient("example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "body.bin"
+            path.write_bytes(b"previous")
+
+            with self.assertRaises(requests.ConnectionError):
+                _ = c.download("https://example.org/file", path)
+
+            self.assertEqual(path.read_bytes(), b"previous")
+            self.assertEqual(list(Path(tmp).iterdir()), [path])
+
+    def test_downloads_writes_each_target(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="body")
+        c = HttpClient("example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"{i}.bin" for i in range(3)]
+            urls = [f"https://example.org/{i}" for i in range(3)]
+            out = c.downloads(zip(urls, paths, strict=True), max_workers=2)
+
+            self.assertEqual(out, paths)
+            self.assertTrue(all(p.read_bytes() == b"body" for p in paths))
+        self.assertEqual(sorted(call["url"] for call in s.calls), urls)
+        self.assertTrue(all(call["stream"] for call in s.calls))
+        self.assertEqual(c.downloads([]), [])
+
+    def test_preconnect_sends_head_and_ignores_status(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(
+            status_code=405,
+            raise_for_status_exc=requests.HTTPError("405 Method Not Allowed"),
+        )
+        c = HttpClient("example.org", session=s)
+
+        c.preconnect()
+        c.preconnect("https://example.org/api")
+
+        self.assertEqual([call["method"] for call in s.calls], ["HEAD", "HEAD"])
+        self.assertEqual(
+            [call["url"] for call in s.calls],
+            ["https://example.org", "https://example.org/api"],
+        )
+        self.assertFalse(s.response.raise_for_status_called)
+        self.assertTrue(s.response.closed)
+
+    def test_send_checks_status_and_returns_none(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="ignored")
+        c = HttpClient("example.org", session=s)
+
+        self.assertIsNone(c.send("DELETE", "https://example.org/del"))
+        self.assertTrue(s.response.raise_for_status_called)
+        self.assertEqual(s.calls[0]["method"], "DELETE")
+        self.assertFalse(s.calls[0]["stream"])
+
     def test_put_text_returns_response_text(self):
         s = _FakeSession()
         s.response = _FakeResponse(text="put")
@@ -1,4 +1,6 @@
 import json
+import subprocess
+import sys
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -6,10 +8,12 @@ from unittest import mock
 
 import pandas as pd
 import rdflib
+import requests
 
-from praeco.exceptions import ValidationError
+from praeco.exceptions import HttpError, ValidationError
 from praeco.services.ontodocker import OntodockerClient
 from praeco.services.ontodocker.models import EndpointInfo
+from praeco.services.ontodocker.sparql import SparqlResource
 
 
 class _FakeRequest:
@@ -37,11 +41,27 @@ class _FakeResponse:
         self._json_value = json_value
         self._json_exc = json_exc
 
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
     def raise_for_status(self):
         if self._raise_for_status_exc is not None:
             raise self._raise_for_status_exc
         return None
 
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        if decode_unicode:
+            for start in range(0, len(self.text), chunk_size):
+                yield self.text[start : start + chunk_size]
+            return
+        body = self.text.encode("utf-8")
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
     def json(self):
         if self._json_exc is not None:
             raise self._json_exc
@@ -59,6 +79,18 @@ class _FakeSession:
         return self.response
 
 
+class _BodyReadingSession(_FakeSession):
+    """Records streamed request bodies while their file is still open."""
+
+    def __init__(self):
+        super().__init__()
+        self.bodies: list[bytes] = []
+
+    def request(self, **kwargs):
+        self.bodies.append(b"".join(kwargs["data"]))
+        return super().request(**kwargs)
+
+
 class TestOntodockerClientInit(unittest.TestCase):
     def test_resources_are_initialized(self):
         s = _FakeSession()
@@ -68,6 +100,13 @@ class TestOntodockerClientInit(unittest.TestCase):
         self.assertIs(c.datasets.client, c)
         self.assertIs(c.sparql.client, c)
 
+    def test_import_does_not_load_pandas(self):
+        code = "import sys, praeco; print('pandas' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(out.stdout.strip(), "False")
+
 
 class TestEndpointsResource(unittest.TestCase):
     def test_list_raw_uses_endpoints_api_and_rectifies_legacy(self):
@@ -112,6 +151,53 @@ class TestEndpointsResource(unittest.TestCase):
             ],
         )
 
+    def test_list_raw_is_not_cached_by_default(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="[]", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        _ = c.endpoints.list_raw()
+        _ = c.endpoints.list_raw()
+
+        self.assertEqual(len(s.calls), 2)
+
+    def test_list_raw_reuses_result_within_cache_ttl(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(
+            text="['https://example.org/api/v1/jena/a/sparql']",
+            request=_FakeRequest("GET"),
+        )
+        c = OntodockerClient("https://example.org", session=s)
+        c.endpoints.cache_ttl = 10.0
+
+        with mock.patch("praeco.services.ontodocker.endpoints.time") as clock:
+            clock.monotonic.return_value = 100.0
+            first = c.endpoints.list_raw()
+            first.append("mutated by caller")
+            clock.monotonic.return_value = 109.0
+            second = c.endpoints.list()
+            self.assertEqual(len(s.calls), 1)
+
+            clock.monotonic.return_value = 110.0
+            _ = c.endpoints.list_raw()
+            self.assertEqual(len(s.calls), 2)
+
+        self.assertEqual([e.dataset for e in second], ["a"])
+
+    def test_cached_endpoints_are_refetched_after_token_change_or_clear(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="[]", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+        c.endpoints.cache_ttl = 60.0
+
+        _ = c.endpoints.list_raw()
+        c.token = "other"
+        _ = c.endpoints.list_raw()
+        c.endpoints.clear_cache()
+        _ = c.endpoints.list_raw()
+
+        self.assertEqual(len(s.calls), 3)
+
 
 class TestDatasetsResource(unittest.TestCase):
     def test_list_returns_unique_sorted_datasets(self):
@@ -166,6 +252,44 @@ class TestDatasetsResource(unittest.TestCase):
         self.assertEqual(s.calls[0]["method"], "DELETE")
         self.assertEqual(s.calls[0]["url"], "https://example.org/api/v1/jena/ds")
 
+    def test_create_and_delete_can_skip_response_body(self):
+        for verb, method in (("create", "PUT"), ("delete", "DELETE")):
+            s = _FakeSession()
+            s.response = _FakeResponse(text="ignored", request=_FakeRequest(method))
+            c = OntodockerClient("https://example.org", session=s)
+
+            with (
+                self.subTest(verb=verb),
+                mock.patch.object(c, f"{method.lower()}_text") as read_body,
+            ):
+                out = getattr(c.datasets, verb)(" ds ", return_body=False)
+
+                self.assertIsNone(out)
+                read_body.assert_not_called()
+                self.assertEqual(s.calls[0]["method"], method)
+                self.assertEqual(
+                    s.calls[0]["url"], "https://example.org/api/v1/jena/ds"
+                )
+
+    def test_create_and_delete_invalidate_cached_endpoint_list(self):
+        for verb in ("create", "delete"):
+            s = _FakeSession()
+            s.response = _FakeResponse(text="[]", request=_FakeRequest("GET"))
+            c = OntodockerClient("https://example.org", session=s)
+            c.endpoints.cache_ttl = 60.0
+
+            with self.subTest(verb=verb):
+                _ = c.datasets.list()
+                _ = c.datasets.upload_graph("ds", rdflib.Graph())
+                _ = c.datasets.list()
+                _ = getattr(c.datasets, verb)("ds")
+                _ = c.datasets.list()
+
+                self.assertEqual(
+                    [call["url"].rsplit("/", 1)[-1] for call in s.calls],
+                    ["endpoints", "ds", "ds", "endpoints"],
+                )
+
     def test_fetch_turtle_validates_name(self):
         s = _FakeSession()
         c = OntodockerClient("https://example.org", session=s)
@@ -184,6 +308,59 @@ class TestDatasetsResource(unittest.TestCase):
         self.assertEqual(s.calls[0]["method"], "GET")
         self.assertEqual(s.calls[0]["url"], "https://example.org/api/v1/jena/ds")
 
+    def test_iter_turtle_streams_text_chunks(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="@prefix : <x> .", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        chunks = c.datasets.iter_turtle(" ds ", chunk_size=4)
+
+        self.assertTrue(s.calls[0]["stream"])
+        self.assertEqual(s.calls[0]["url"], "https://example.org/api/v1/jena/ds")
+        self.assertEqual(next(chunks), "@pre")
+        self.assertEqual("@pre" + "".join(chunks), "@prefix : <x> .")
+        self.assertTrue(s.response.closed)
+
+    def test_iter_turtle_validates_name_and_raises_http_error_eagerly(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(
+            status_code=404,
+            request=_FakeRequest("GET"),
+            raise_for_status_exc=requests.HTTPError("404 Client Error"),
+        )
+        c = OntodockerClient("https://example.org", session=s)
+
+        with self.assertRaises(ValidationError):
+            _ = c.datasets.iter_turtle(" ")
+        with self.assertRaises(HttpError):
+            _ = c.datasets.iter_turtle("ds")
+        self.assertTrue(s.response.closed)
+
+    def test_fetch_turtles_fetches_each_unique_dataset(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="@prefix : <x> .", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        out = c.datasets.fetch_turtles([" a ", "b", "a"], max_workers=2)
+
+        self.assertEqual(out, {"a": "@prefix : <x> .", "b": "@prefix : <x> ."})
+        self.assertEqual(
+            sorted(call["url"] for call in s.calls),
+            [
+                "https://example.org/api/v1/jena/a",
+                "https://example.org/api/v1/jena/b",
+            ],
+        )
+
+    def test_fetch_turtles_validates_names_before_requesting(self):
+        s = _FakeSession()
+        c = OntodockerClient("https://example.org", session=s)
+
+        with self.assertRaises(ValidationError):
+            _ = c.datasets.fetch_turtles(["a", " "])
+        self.assertEqual(s.calls, [])
+        self.assertEqual(c.datasets.fetch_turtles([]), {})
+
     def test_download_turtle_validates_name_and_filename(self):
         s = _FakeSession()
         c = OntodockerClient("https://example.org", session=s)
@@ -206,6 +383,83 @@ class TestDatasetsResource(unittest.TestCase):
 
             self.assertEqual(out, path)
             self.assertEqual(path.read_text(encoding="utf-8"), "@prefix : <x> .")
+        self.assertTrue(s.calls[0]["stream"])
+        self.assertTrue(s.response.closed)
+
+    def test_download_turtle_does_not_create_file_on_http_error(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(
+            status_code=404,
+            request=_FakeRequest("GET"),
+            raise_for_status_exc=requests.HTTPError("404 Client Error"),
+        )
+        c = OntodockerClient("https://example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out.ttl"
+            with self.assertRaises(HttpError):
+                _ = c.datasets.download_turtle("ds", path)
+            self.assertFalse(path.exists())
+
+    def test_download_turtles_writes_one_file_per_dataset(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="@prefix : <x> .", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            out = c.datasets.download_turtles([" a ", "b", "a"], tmp, max_workers=2)
+
+            root = Path(tmp).resolve()
+            self.assertEqual(out, {"a": root / "a.ttl", "b": root / "b.ttl"})
+            self.assertTrue(
+                all(
+                    p.read_text(encoding="utf-8") == "@prefix : <x> ."
+                    for p in out.values()
+                )
+            )
+        self.assertEqual(
+            sorted(call["url"] for call in s.calls),
+            [
+                "https://example.org/api/v1/jena/a",
+                "https://example.org/api/v1/jena/b",
+            ],
+        )
+
+    def test_download_turtles_defaults_to_all_datasets(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="ttl", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+        c.datasets.list = mock.Mock(return_value=["a", "b"])
+
+        with TemporaryDirectory() as tmp:
+            out = c.datasets.download_turtles(directory=tmp)
+
+        self.assertEqual(list(out), ["a", "b"])
+
+    def test_download_turtles_resolves_relative_directory_once(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="ttl", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        with (
+            TemporaryDirectory() as tmp,
+            mock.patch("os.getcwd", return_value=tmp) as cwd,
+        ):
+            Path(tmp, "out").mkdir()
+            out = c.datasets.download_turtles(["a", "b"], "out")
+
+            self.assertTrue(all(p.is_absolute() for p in out.values()))
+            self.assertEqual(out["a"], Path(tmp).resolve() / "out" / "a.ttl")
+            self.assertTrue(out["b"].is_file())
+        self.assertEqual(cwd.call_count, 1)
+
+    def test_download_turtles_validates_names_before_requesting(self):
+        s = _FakeSession()
+        c = OntodockerClient("https://example.org", session=s)
+
+        with self.assertRaises(ValidationError):
+            _ = c.datasets.download_turtles(["a", " "], "unused")
+        self.assertEqual(s.calls, [])
 
     def test_upload_turtlefile_validates_inputs(self):
         s = _FakeSession()
@@ -241,7 +495,7 @@ class TestDatasetsResource(unittest.TestCase):
             )
 
             for label, value in cases:
-                s = _FakeSession()
+                s = _BodyReadingSession()
                 s.response = _FakeResponse(text="ok", request=_FakeRequest("POST"))
                 c = OntodockerClient("https://example.org", session=s)
 
@@ -253,7 +507,72 @@ class TestDatasetsResource(unittest.TestCase):
                     self.assertEqual(
                         s.calls[0]["url"], "https://example.org/api/v1/jena/ds"
                     )
-                    self.assertIn("file", s.calls[0]["files"])
+                    self.assertIsNone(s.calls[0]["files"])
+                    self.assertTrue(
+                        s.calls[0]["headers"]["Content-Type"].startswith(
+                            "multipart/form-data; boundary="
+                        )
+                    )
+                    self.assertIn(
+                        b'name="file"; filename="in.ttl"\r\n'
+                        b"Content-Type: text/turtle\r\n\r\n"
+                        b"@prefix : <x> .\r\n",
+                        s.bodies[0],
+                    )
+
+    def test_upload_turtlefile_sends_body_in_requested_chunks(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="ok", request=_FakeRequest("POST"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            turtlefile = Path(tmp) / "in.ttl"
+            turtlefile.write_text("@prefix : <x> .", encoding="utf-8")
+            _ = c.datasets.upload_turtlefile("ds", turtlefile, chunk_size=5)
+
+        self.assertEqual(s.calls[0]["data"].chunk_size, 5)
+
+    def test_upload_turtlefiles_posts_each_file_in_order(self):
+        s = _BodyReadingSession()
+        s.response = _FakeResponse(text="ok", request=_FakeRequest("POST"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / "a.ttl", Path(tmp) / "b.ttl"]
+            for path in paths:
+                path.write_text("@prefix : <x> .", encoding="utf-8")
+
+            out = c.datasets.upload_turtlefiles("ds", [str(paths[0]), paths[1]])
+
+        self.assertEqual(out, ["ok", "ok"])
+        self.assertEqual(
+            [b'filename="a.ttl"' in body for body in s.bodies], [True, False]
+        )
+        self.assertEqual(
+            [b'filename="b.ttl"' in body for body in s.bodies], [False, True]
+        )
+        self.assertTrue(
+            all(call["url"] == "https://example.org/api/v1/jena/ds" for call in s.calls)
+        )
+
+    def test_upload_turtlefiles_checks_all_paths_before_uploading(self):
+        s = _FakeSession()
+        c = OntodockerClient("https://example.org", session=s)
+
+        with TemporaryDirectory() as tmp:
+            present = Path(tmp) / "a.ttl"
+            present.write_text("@prefix : <x> .", encoding="utf-8")
+
+            with self.assertRaises(FileNotFoundError):
+                _ = c.datasets.upload_turtlefiles(
+                    "ds", [present, Path(tmp) / "missing.ttl"]
+                )
+            with self.assertRaisesRegex(
+                ValidationError, "turtlefile must be a non-empty path"
+            ):
+                _ = c.datasets.upload_turtlefiles("ds", [present, " "])
+
+        self.assertEqual(s.calls, [])
 
     def test_upload_graph_validates_name(self):
         s = _FakeSession()
@@ -322,6 +641,9 @@ class TestDatasetsResource(unittest.TestCase):
         self.assertEqual(posted[2], "text/turtle")
 
 
+_ONE_ROW_RESULT = '{"results": {"bindings": [{"a": {"value": "1"}}]}}'
+
+
 class TestSparqlResource(unittest.TestCase):
     def test_endpoint_validates_dataset(self):
         s = _FakeSession()
@@ -337,6 +659,20 @@ class TestSparqlResource(unittest.TestCase):
             "https://example.org/api/v1/jena/ds/sparql",
         )
 
+    def test_urls_reuse_prefix_built_at_init(self):
+        s = _FakeSession()
+        c = OntodockerClient("example.org:8443", session=s)
+
+        with mock.patch.object(c, "url_for", side_effect=AssertionError("rebuilt")):
+            self.assertEqual(
+                c.sparql.endpoint("ds"),
+                "https://example.org:8443/api/v1/jena/ds/sparql",
+            )
+            self.assertEqual(
+                c.datasets._dataset_url("ds"),
+                "https://example.org:8443/api/v1/jena/ds",
+            )
+
     def test_query_raw_validates_dataset_and_query(self):
         s = _FakeSession()
         c = OntodockerClient("https://example.org", session=s)
@@ -407,6 +743,18 @@ class TestSparqlResource(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", columns=["a"])
 
+    def test_query_df_decodes_with_orjson_when_installed(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text="{}", request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+        fake = mock.Mock(loads=mock.Mock(return_value=json.loads(_ONE_ROW_RESULT)))
+
+        with mock.patch("praeco.transport.request.orjson", fake):
+            df = c.sparql.query_df("ds", "SELECT ?a WHERE {}", columns=["a"])
+
+        fake.loads.assert_called_once_with("{}")
+        self.assertEqual(df.shape, (1, 1))
+
     def test_query_df_delegates_to_query_raw_with_accept_header(self):
         s = _FakeSession()
         c = OntodockerClient("https://example.org", session=s)
@@ -427,6 +775,139 @@ class TestSparqlResource(unittest.TestCase):
         self.assertEqual(list(df.columns), ["a"])
         self.assertEqual(df.iloc[0].tolist(), ["1"])
 
+    def test_query_df_is_not_cached_by_default(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", columns=["a"])
+        _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", columns=["a"], cache=False)
+
+        self.assertEqual(len(s.calls), 2)
+
+    def test_query_df_cache_reuses_result_and_returns_copies(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        first = c.sparql.query_df("ds", "SELECT ?a WHERE {}", ["a"], cache=True)
+        first.loc[0, "a"] = "mutated"
+        second = c.sparql.query_df(" ds ", "  SELECT ?a WHERE {}\n", ["a"], cache=True)
+
+        self.assertEqual(len(s.calls), 1)
+        self.assertEqual(second.iloc[0]["a"], "1")
+        self.assertIsNot(first, second)
+
+    def test_query_df_cache_key_includes_columns_and_token(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", ["a"], cache=True)
+        _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", ["a", "b"], cache=True)
+        c.token = "other"
+        _ = c.sparql.query_df("ds", "SELECT ?a WHERE {}", ["a"], cache=True)
+
+        self.assertEqual(len(s.calls), 3)
+
+    def test_query_df_cache_evicts_least_recently_used(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+        c.sparql.cache_max = 2
+
+        for query in ("Q1", "Q2", "Q1", "Q3"):  # Q2 is least recently used
+            _ = c.sparql.query_df("ds", query, ["a"], cache=True)
+        self.assertEqual(len(s.calls), 3)
+
+        _ = c.sparql.query_df("ds", "Q1", ["a"], cache=True)
+        self.assertEqual(len(s.calls), 3)
+        _ = c.sparql.query_df("ds", "Q2", ["a"], cache=True)
+        self.assertEqual(len(s.calls), 4)
+
+    def test_pinned_results_survive_eviction(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+        c.sparql.cache_max = 1
+
+        _ = c.sparql.query_df("ds", "base", ["a"], pin=True)
+        for query in ("Q1", "Q2"):
+            _ = c.sparql.query_df("ds", query, ["a"], cache=True)
+        _ = c.sparql.query_df("ds", "base", ["a"], cache=True)
+
+        self.assertEqual(len(s.calls), 3)
+
+    def test_clear_cache_drops_results_of_one_or_all_datasets(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        def query_both():
+            _ = c.sparql.query_df("a", "Q", ["a"], cache=True)
+            _ = c.sparql.query_df("b", "Q", ["a"], pin=True)
+
+        query_both()
+        c.sparql.clear_cache(" a ")
+        query_both()
+        self.assertEqual(len(s.calls), 3)
+
+        c.sparql.clear_cache()
+        query_both()
+        self.assertEqual(len(s.calls), 5)
+
+    def test_dataset_mutations_invalidate_cached_results(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        _ = c.sparql.query_df("ds", "Q", ["a"], pin=True)
+        _ = c.sparql.query_df("other", "Q", ["a"], cache=True)
+        _ = c.datasets.delete("ds")
+        _ = c.sparql.query_df("ds", "Q", ["a"], cache=True)
+        _ = c.sparql.query_df("other", "Q", ["a"], cache=True)
+
+        self.assertEqual(
+            [call["method"] for call in s.calls], ["GET", "GET", "DELETE", "GET"]
+        )
+
+    def test_cached_query_df_validates_dataset_and_query(self):
+        s = _FakeSession()
+        c = OntodockerClient("https://example.org", session=s)
+
+        for dataset, query in ((None, "Q"), ("ds", None), (" ", "Q")):
+            with (
+                self.subTest(dataset=dataset, query=query),
+                self.assertRaises(ValidationError),
+            ):
+                _ = c.sparql.query_df(dataset, query, ["a"], cache=True)
+        self.assertEqual(s.calls, [])
+
+    def test_query_df_cache_key_matches_endpoint_normalization(self):
+        s = _FakeSession()
+        s.response = _FakeResponse(text=_ONE_ROW_RESULT, request=_FakeRequest("GET"))
+        c = OntodockerClient("https://example.org", session=s)
+
+        _ = c.sparql.query_df("ds/", "Q", ["a"], cache=True)
+        _ = c.sparql.query_df("/ds", "Q", ["a"], pin=True)
+        self.assertEqual(len(s.calls), 1)
+
+        _ = c.datasets.delete("ds")
+        _ = c.sparql.query_df("ds/", "Q", ["a"], cache=True)
+        self.assertEqual([call["method"] for call in s.calls], ["GET", "DELETE", "GET"])
+
+    def test_negative_cache_max_is_rejected(self):
+        s = _FakeSession()
+        c = OntodockerClient("https://example.org", session=s)
+
+        with self.assertRaisesRegex(ValueError, "cache_max must be >= 0"):
+            _ = SparqlResource(c, cache_max=-1)
+
+        c.sparql.cache_max = -1
+        with self.assertRaisesRegex(ValueError, "cache_max must be >= 0"):
+            _ = c.sparql.query_df("ds", "Q", ["a"], cache=True)
+        self.assertEqual(s.calls, [])
+
     def test_query_df_does_not_call_query_raw_when_columns_invalid(self):
         s = _FakeSession()
         c = OntodockerClient("https://example.org", session=s)
@@ -34,6 +34,11 @@ class TestBearerHeaders(unittest.TestCase):
         result = bearer_headers(token)
         self.assertEqual(result["Authorization"], f"Bearer {token}")
 
+    def test_returned_dict_is_not_shared_between_calls(self):
+        first = bearer_headers("abc")
+        first["Authorization"] = "changed"
+        self.assertEqual(bearer_headers("abc"), {"Authorization": "Bearer abc"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from email.parser import BytesParser
+from email.policy import HTTP
+from io import BytesIO
+
+from praeco.transport.multipart import MultipartFileBody
+
+
+def _parse(body: MultipartFileBody, payload: bytes):
+    head = f"Content-Type: {body.content_type}\r\n\r\n".encode("ascii")
+    return BytesParser(policy=HTTP).parsebytes(head + payload)
+
+
+class TestMultipartFileBody(unittest.TestCase):
+    def test_encodes_single_file_part(self):
+        body = MultipartFileBody(
+            "file",
+            BytesIO(b"line 1\nline 2\n"),
+            filename="in.ttl",
+            content_type="text/turtle",
+        )
+
+        msg = _parse(body, b"".join(body))
+        (part,) = msg.iter_parts()
+
+        self.assertEqual(part.get_param("name", header="content-disposition"), "file")
+        self.assertEqual(part.get_filename(), "in.ttl")
+        self.assertEqual(part.get_content_type(), "text/turtle")
+        self.assertEqual(part.get_payload(decode=True), b"line 1\nline 2\n")
+
+    def test_len_matches_encoded_size(self):
+        body = MultipartFileBody("file", BytesIO(b"x" * 1000), filename="a.ttl")
+        self.assertEqual(len(body), len(b"".join(body)))
+
+    def test_len_only_counts_content_after_current_position(self):
+        f = BytesIO(b"skipme-payload")
+        f.seek(len(b"skipme-"))
+        body = MultipartFileBody("file", f, filename="a.ttl")
+
+        payload = b"".join(body)
+
+        self.assertEqual(len(body), len(payload))
+        self.assertNotIn(b"skipme", payload)
+
+    def test_iteration_yields_bounded_chunks(self):
+        body = MultipartFileBody(
+            "file", BytesIO(b"y" * 100), filename="a.ttl", chunk_size=16
+        )
+
+        chunks = list(body)
+
+        self.assertTrue(all(len(chunk) <= 16 for chunk in chunks))
+        self.assertEqual(len(b"".join(chunks)), len(body))
+
+    def test_chunks_span_part_boundaries(self):
+        body = MultipartFileBody(
+            "file", BytesIO(b"z" * 50), filename="a.ttl", chunk_size=7
+        )
+
+        chunks = list(body)
+
+        self.assertTrue(all(len(chunk) == 7 for chunk in chunks[:-1]))
+        self.assertIn(b"z" * 50, b"".join(chunks))
+
+    def test_chunk_size_must_be_positive(self):
+        with self.assertRaisesRegex(ValueError, "chunk_size must be > 0"):
+            MultipartFileBody("file", BytesIO(b""), filename="a.ttl", chunk_size=0)
+
+    def test_body_is_not_file_like(self):
+        # urllib3 reads file-like bodies in its own block size; an iterable
+        # body keeps `chunk_size` in effect.
+        body = MultipartFileBody("file", BytesIO(b""), filename="a.ttl")
+        self.assertFalse(hasattr(body, "read"))
+
+    def test_quotes_and_newlines_in_filename_are_escaped(self):
+        body = MultipartFileBody("file", BytesIO(b""), filename='a"b\r\n.ttl')
+        self.assertIn(b'filename="a%22b%0D%0A.ttl"', b"".join(body))
+
+    def test_boundary_differs_per_body(self):
+        a = MultipartFileBody("file", BytesIO(b""), filename="a.ttl")
+        b = MultipartFileBody("file", BytesIO(b""), filename="a.ttl")
+        self.assertNotEqual(a.content_type, b.content_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
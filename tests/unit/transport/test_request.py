@@ -1,9 +1,20 @@
+import io
+import json
 import unittest
+from unittest import mock
 
 import requests
+import urllib3
 
 from praeco.exceptions import HttpError
-from praeco.transport.request import _raise_for_status_with_body, read_json
+from praeco.transport.request import (
+    _raise_for_status_with_body,
+    check_status,
+    iter_text,
+    loads_json,
+    read_json,
+    read_text,
+)
 
 
 class _FakeRequest:
@@ -34,6 +45,10 @@ class _FakeResponse:
         self.raise_for_status_called = False
         self.json_called = False
 
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
     def raise_for_status(self):
         self.raise_for_status_called = True
         if self._raise_for_status_exc is not None:
@@ -79,8 +94,57 @@ class TestRaiseForStatusWithBody(unittest.TestCase):
 
         self.assertEqual(ctx.exception.method, "HTTP")
 
+    def test_error_body_is_truncated(self):
+        resp = _FakeResponse(
+            status_code=500,
+            request=_FakeRequest("GET"),
+            raise_for_status_exc=requests.HTTPError("500 Server Error"),
+            text="x" * 10_000,
+        )
+
+        with self.assertRaises(HttpError) as ctx:
+            _raise_for_status_with_body(resp)
+
+        self.assertEqual(ctx.exception.response_text, "x" * 4096)
+
+    def test_streamed_error_body_reads_only_the_limit(self):
+        resp = requests.Response()
+        resp.status_code = 500
+        resp.url = "https://example.test/api"
+        resp.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(b"x" * 10_000), preload_content=False
+        )
+
+        with self.assertRaises(HttpError) as ctx:
+            _raise_for_status_with_body(resp)
+
+        self.assertEqual(ctx.exception.response_text, "x" * 4096)
+        self.assertEqual(resp.raw.tell(), 4096)
+
+    def test_full_error_body_can_be_requested_via_environment(self):
+        resp = _FakeResponse(
+            status_code=500,
+            request=_FakeRequest("GET"),
+            raise_for_status_exc=requests.HTTPError("500 Server Error"),
+            text="x" * 10_000,
+        )
+
+        with (
+            mock.patch.dict("os.environ", {"PRAECO_FULL_ERROR_BODY": "1"}),
+            self.assertRaises(HttpError) as ctx,
+        ):
+            _raise_for_status_with_body(resp)
+
+        self.assertEqual(len(ctx.exception.response_text), 10_000)
+
 
 class TestReadJson(unittest.TestCase):
+    def setUp(self):
+        # Exercise the requests-based decoder whether or not orjson is installed.
+        patcher = mock.patch("praeco.transport.request.orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_decodes_json_on_success(self):
         resp = _FakeResponse(
             status_code=200,
@@ -143,5 +207,139 @@ class TestReadJson(unittest.TestCase):
             _ = read_json(resp)
 
 
+class TestReadJsonOrjson(unittest.TestCase):
+    def setUp(self):
+        self.orjson = mock.Mock(loads=mock.Mock(side_effect=json.loads))
+        patcher = mock.patch("praeco.transport.request.orjson", self.orjson)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_decodes_raw_bytes_without_response_json(self):
+        resp = _response(b'{"ok": true}', "application/json")
+        with mock.patch.object(requests.Response, "json") as resp_json:
+            self.assertEqual(read_json(resp), {"ok": True})
+        resp_json.assert_not_called()
+        self.orjson.loads.assert_called_once_with(b'{"ok": true}')
+
+    def test_decode_error_is_wrapped(self):
+        resp = _response(b"<<< not json >>>", "application/json")
+        with self.assertRaises(HttpError) as ctx:
+            _ = read_json(resp)
+        self.assertEqual(ctx.exception.message, "Failed to decode JSON response.")
+        self.assertIsInstance(ctx.exception.__cause__, ValueError)
+
+
+def _response(body: bytes, content_type: str | None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    if content_type is not None:
+        resp.headers["Content-Type"] = content_type
+    return resp
+
+
+class TestLoadsJson(unittest.TestCase):
+    def test_uses_stdlib_without_orjson(self):
+        with mock.patch("praeco.transport.request.orjson", None):
+            self.assertEqual(loads_json('{"a": [1]}'), {"a": [1]})
+            with self.assertRaises(json.JSONDecodeError):
+                loads_json("not json")
+
+    def test_prefers_orjson_when_installed(self):
+        fake = mock.Mock(loads=mock.Mock(return_value={"ok": True}))
+        with mock.patch("praeco.transport.request.orjson", fake):
+            self.assertEqual(loads_json('{"ok": true}'), {"ok": True})
+        fake.loads.assert_called_once_with('{"ok": true}')
+
+
+class TestReadText(unittest.TestCase):
+    def test_undeclared_charset_decodes_as_utf8_without_detection(self):
+        for content_type in ("text/turtle", "application/octet-stream", None):
+            with (
+                self.subTest(content_type=content_type),
+                mock.patch.object(
+                    requests.Response,
+                    "apparent_encoding",
+                    new_callable=mock.PropertyMock,
+                    side_effect=AssertionError("charset detection used"),
+                ),
+            ):
+                resp = _response("<ä> a <ö> .".encode(), content_type)
+                self.assertEqual(read_text(resp), "<ä> a <ö> .")
+
+    def test_declared_charset_is_respected(self):
+        resp = _response("ä".encode("latin-1"), 'text/plain; charset="ISO-8859-1"')
+        self.assertEqual(read_text(resp), "ä")
+
+
+class TestCheckStatus(unittest.TestCase):
+    def test_success_does_not_decode_body(self):
+        with mock.patch.object(
+            requests.Response,
+            "text",
+            new_callable=mock.PropertyMock,
+            side_effect=AssertionError("body decoded"),
+        ):
+            self.assertIsNone(check_status(_response(b"created", "text/plain")))
+
+    def test_error_raises_http_error(self):
+        resp = _FakeResponse(
+            status_code=404,
+            text="missing",
+            request=_FakeRequest("DELETE"),
+            raise_for_status_exc=requests.HTTPError("404 Client Error"),
+        )
+        with self.assertRaises(HttpError) as ctx:
+            check_status(resp)
+        self.assertEqual(ctx.exception.response_text, "missing")
+
+
+class _StreamedResponse(requests.Response):
+    def __init__(self, body: bytes, content_type: str | None, status_code=200):
+        super().__init__()
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+        self.url = "https://example.test/api"
+        if content_type is not None:
+            self.headers["Content-Type"] = content_type
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+class TestIterText(unittest.TestCase):
+    def test_decodes_multibyte_characters_split_across_chunks(self):
+        resp = _StreamedResponse("äöü€".encode(), "text/turtle")
+
+        chunks = list(iter_text(resp, chunk_size=1))
+
+        self.assertEqual("".join(chunks), "äöü€")
+        self.assertTrue(resp.closed)
+
+    def test_declared_charset_is_respected(self):
+        resp = _StreamedResponse("ä".encode("latin-1"), "text/plain; charset=latin-1")
+        self.assertEqual("".join(iter_text(resp)), "ä")
+
+    def test_error_status_raises_before_iteration_and_closes(self):
+        resp = _StreamedResponse(b"missing", None, status_code=404)
+
+        with self.assertRaises(HttpError):
+            _ = iter_text(resp)
+        self.assertTrue(resp.closed)
+
+    def test_body_is_read_lazily(self):
+        resp = _StreamedResponse(b"abcdef", None)
+
+        chunks = iter_text(resp, chunk_size=2)
+
+        self.assertEqual(resp.raw.tell(), 0)
+        self.assertEqual(next(chunks), "ab")
+        self.assertFalse(resp.closed)
+        chunks.close()
+        self.assertTrue(resp.closed)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,9 @@ import unittest
 
 import requests
 
+import praeco
 from praeco.transport import create_session
+from praeco.transport.session import DEFAULT_POOL_MAXSIZE, DEFAULT_RETRY
 
 
 class TestCreateSession(unittest.TestCase):
@@ -19,6 +21,38 @@ class TestCreateSession(unittest.TestCase):
         self.assertEqual(s.headers.get("X-Test"), "abc")
         self.assertEqual(s.headers.get("Authorization"), "Bearer token")
 
+    def test_user_agent_identifies_praeco(self):
+        s = create_session()
+        self.assertEqual(s.headers["User-Agent"], f"praeco/{praeco.__version__}")
+
+    def test_explicit_headers_override_defaults(self):
+        s = create_session(headers={"User-Agent": "custom"})
+        self.assertEqual(s.headers["User-Agent"], "custom")
+
+    def test_adapter_uses_enlarged_pool_for_both_schemes(self):
+        s = create_session()
+        for prefix in ("https://", "http://"):
+            with self.subTest(prefix=prefix):
+                adapter = s.get_adapter(f"{prefix}example.org")
+                self.assertEqual(adapter._pool_maxsize, DEFAULT_POOL_MAXSIZE)
+
+    def test_pool_maxsize_is_configurable(self):
+        s = create_session(pool_maxsize=3)
+        self.assertEqual(s.get_adapter("https://example.org")._pool_maxsize, 3)
+
+    def test_default_retry_covers_idempotent_gateway_errors(self):
+        retry = create_session().get_adapter("https://example.org").max_retries
+        self.assertIs(retry, DEFAULT_RETRY)
+        self.assertEqual(retry.total, 3)
+        self.assertEqual(set(retry.status_forcelist), {502, 503, 504})
+        self.assertNotIn("POST", retry.allowed_methods)
+        self.assertFalse(retry.raise_on_status)
+        self.assertFalse(retry.respect_retry_after_header)
+
+    def test_retries_can_be_disabled(self):
+        s = create_session(max_retries=0)
+        self.assertEqual(s.get_adapter("https://example.org").max_retries.total, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,13 @@
 import unittest
+from unittest import mock
 
 from praeco.exceptions import InvalidAddressError, ValidationError
-from praeco.transport.url import join_url, normalize_base_url, quote_path_segment
+from praeco.transport.url import (
+    _normalize_base_url,
+    join_url,
+    normalize_base_url,
+    quote_path_segment,
+)
 
 
 class TestNormalizeBaseUrl(unittest.TestCase):
@@ -58,6 +64,44 @@ class TestNormalizeBaseUrl(unittest.TestCase):
             "https://example.org",
         )
 
+    def test_normalized_addresses_skip_urlsplit(self):
+        _normalize_base_url.cache_clear()
+        with mock.patch("praeco.transport.url.urlsplit") as split:
+            for addr in ("https://example.org", " http://user@example.org:8080 "):
+                with self.subTest(addr=addr):
+                    self.assertEqual(normalize_base_url(addr), addr.strip())
+        split.assert_not_called()
+
+    def test_unusual_addresses_still_take_the_full_parse(self):
+        cases = {
+            "https://example.org/": "https://example.org",
+            "HTTPS://example.org": "https://example.org",
+            "https://[::1]:8080": "https://[::1]:8080",
+            "https://a\tb": "https://ab",
+        }
+        for addr, expected in cases.items():
+            with self.subTest(addr=addr):
+                self.assertEqual(normalize_base_url(addr), expected)
+        with self.assertRaises(InvalidAddressError):
+            normalize_base_url("https://")
+        with self.assertRaises(ValueError):
+            normalize_base_url("https://[::1")
+
+    def test_non_ascii_hosts_keep_the_nfkc_check(self):
+        for addr in ("https://example.org\uff03x", "https://ex\u2100ample.org"):
+            with self.subTest(addr=addr), self.assertRaisesRegex(ValueError, "NFKC"):
+                normalize_base_url(addr)
+
+    def test_repeated_calls_are_served_from_cache(self):
+        _normalize_base_url.cache_clear()
+        for _ in range(3):
+            self.assertEqual(
+                normalize_base_url("example.org", allowed_schemes=["https"]),
+                "https://example.org",
+            )
+        info = _normalize_base_url.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
 
 class TestJoinUrl(unittest.TestCase):
     def test_blank_base_raises(self):